@@ -0,0 +1,40 @@
+"""문제별 참조 엔진.
+
+스터디 풀이를 대신하지 않고, 같은 문제를 자료구조/알고리즘을 바꿔 다시 쓴 구현이다.
+각 모듈은 파싱된 입력을 받는 ``solve`` 계열 함수와, 문제의 표준 입력 형식을 읽어
+``#tc 답`` 을 출력하는 ``main()`` 을 가진다.
+
+    python -m engines swea-1767 < input.txt
+"""
+
+import importlib
+
+# baseName -> 모듈 이름
+REGISTRY = {
+    'etc-A_2025_나무의_키': 'etc_A_2025_나무의_키',
+    'etc-몬스터_마스터': 'etc_몬스터_마스터',
+    'etc-사격_게임': 'etc_사격_게임',
+    'etc-학교_졸업하기': 'etc_학교_졸업하기',
+    'swea-1215': 'swea_1215',
+    'swea-1216': 'swea_1216',
+    'swea-1244': 'swea_1244',
+    'swea-1248': 'swea_1248',
+    'swea-1249': 'swea_1249',
+    'swea-1267': 'swea_1267',
+    'swea-1486': 'swea_1486',
+    'swea-1767': 'swea_1767',
+    'swea-1865': 'swea_1865',
+    'swea-1953': 'swea_1953',
+    'swea-1989': 'swea_1989',
+    'swea-2115': 'swea_2115',
+    'swea-5215': 'swea_5215',
+    'swea-7465': 'swea_7465',
+}
+
+
+def load(base_name: str):
+    try:
+        module = REGISTRY[base_name]
+    except KeyError:
+        raise KeyError(f'no engine registered for {base_name}') from None
+    return importlib.import_module(f'{__name__}.{module}')
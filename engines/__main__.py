@@ -0,0 +1,27 @@
+"""python -m engines: 문제별 엔진을 표준 입력으로 실행
+
+    python -m engines swea-1767 < input.txt
+    python -m engines --list
+"""
+
+import argparse
+import sys
+
+from . import REGISTRY, load
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m engines', description='문제별 참조 엔진 실행')
+    parser.add_argument('problem', nargs='?', help='baseName (예: swea-1767)')
+    parser.add_argument('--list', action='store_true', help='등록된 문제 목록')
+    args = parser.parse_args(argv)
+
+    if args.list or not args.problem:
+        print('\n'.join(sorted(REGISTRY)))
+        return 0
+    load(args.problem).main()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
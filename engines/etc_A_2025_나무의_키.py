@@ -0,0 +1,89 @@
+"""etc-A_2025_나무의_키: 닫힌 식 O(N) 풀이와 작은 입력 전수 검증기.
+
+홀수 날에는 한 나무를 1, 짝수 날에는 2 키울 수 있고(물을 안 줘도 된다),
+모든 나무를 처음 가장 컸던 나무의 키에 맞추는 최소 날짜를 구한다.
+
+나무별 부족분 d 를 2 로 나눠 ``twos = Σ d // 2``, ``ones = Σ d % 2`` 로 센다.
+짝수 날이 홀수 날보다 많이 필요하면 2 하나를 1 두 개로 쪼개는 편이 낫고,
+쪼갤 때마다 (twos − ones) 가 3 줄어들므로 ``twos ≤ ones + 1`` 이 될 때까지의 횟수는
+``ceil((twos − ones − 1) / 3)`` 이다. 그 뒤
+- ones > twos 이면 마지막이 홀수 날: 2·ones − 1
+- 아니면 마지막이 짝수 날: 2·twos
+
+``verify`` 는 날마다 가능한 모든 물 주기(안 주기 포함)를 BFS 로 펼쳐 작은 입력에서 식과 비교한다.
+
+    python -m engines etc-A_2025_나무의_키 < input.txt
+    python -m engines.etc_A_2025_나무의_키 --verify
+"""
+
+import random
+import sys
+
+from judge.fastio import FastReader
+
+
+def min_days(heights: list[int], target: int | None = None) -> int:
+    if not heights:
+        return 0
+    if target is None:
+        target = max(heights)
+    ones = twos = 0
+    for h in heights:
+        d = target - h
+        twos += d >> 1
+        ones += d & 1
+    if twos > ones + 1:
+        k = (twos - ones + 1) // 3     # ceil((twos - ones - 1) / 3)
+        twos -= k
+        ones += 2 * k
+    return 2 * ones - 1 if ones > twos else 2 * twos
+
+
+def brute_force(heights: list[int]) -> int:
+    """날짜별 상태(남은 부족분의 정렬 튜플) 집합을 BFS 로 펼친 정답"""
+    goal = max(heights)
+    states = {tuple(sorted(goal - h for h in heights if h < goal))}
+    day = 0
+    while () not in states:
+        day += 1
+        amount = 1 if day % 2 else 2
+        nxt = set(states)   # 물을 안 주는 경우
+        for state in states:
+            for i, d in enumerate(state):
+                if d >= amount and (i == 0 or state[i - 1] != d):
+                    rest = list(state)
+                    if d == amount:
+                        rest.pop(i)
+                    else:
+                        rest[i] = d - amount
+                    nxt.add(tuple(sorted(rest)))
+        states = nxt
+    return day
+
+
+def verify(trials: int = 2000, max_trees: int = 5, max_height: int = 8, seed: int = 0) -> int:
+    """무작위 작은 입력에서 min_days 와 brute_force 를 비교하고 통과한 개수를 돌려준다"""
+    rng = random.Random(seed)
+    for _ in range(trials):
+        heights = [rng.randint(1, max_height) for _ in range(rng.randint(1, max_trees))]
+        expected, got = brute_force(heights), min_days(heights)
+        if expected != got:
+            raise AssertionError(f'{heights}: brute force {expected}, formula {got}')
+    return trials
+
+
+def main() -> None:
+    reader = FastReader.from_stdin()
+    T = reader.int()
+    out = []
+    for tc in range(1, T + 1):
+        reader.int()
+        out.append(f'#{tc} {min_days(reader.ints())}')
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    if sys.argv[1:] == ['--verify']:
+        print(f'{verify()} cases ok')
+    else:
+        main()
@@ -0,0 +1,108 @@
+"""etc-몬스터_마스터: 선행 조건 마스크를 건 Held-Karp 비트마스크 DP.
+
+몬스터 k 와 고객 −k 를 한 번씩 들르되 고객 −k 는 몬스터 k 를 잡은 뒤에만 갈 수 있다.
+M 쌍이면 지점은 2M 개이고, 몬스터 k 를 비트 k − 1, 고객 −k 를 비트 M + k − 1 에 둔다.
+방문 마스크에서 다음에 갈 수 있는 지점은
+
+    ``free & (low | (mask & low) << M)``  (low = 몬스터 비트 전부, free = 아직 안 간 지점)
+
+한 번으로 걸러지므로 선행 조건을 따로 검사하지 않는다.
+지점 간 맨해튼 거리는 처음에 평탄 표로 한 번만 계산하고, ``best[mask·n + last]`` 를 마스크
+오름차순으로 채운다. O(2^2M · (2M)^2) 이라 M = 4 면 256 × 8 칸짜리 표다.
+"""
+
+from array import array
+
+from judge.fastio import FastReader
+
+UNREACHED = 1 << 30
+
+
+def locate(board: list[list[int]]) -> list[tuple[int, int]]:
+    """몬스터 1..M, 고객 1..M 순서의 좌표 목록"""
+    found = {}
+    for r, row in enumerate(board):
+        for c, v in enumerate(row):
+            if v:
+                found[v] = (r, c)
+    M = len(found) // 2
+    return [found[k] for k in range(1, M + 1)] + [found[-k] for k in range(1, M + 1)]
+
+
+def shortest_route(
+    points: list[tuple[int, int]],
+    start: tuple[int, int] = (0, 0),
+    with_order: bool = False,
+):
+    """points: ``locate`` 순서의 좌표. 최소 이동 거리, with_order 이면 (거리, 방문 번호 목록).
+
+    방문 번호는 몬스터 k 가 k, 고객 −k 가 −k 이다.
+    """
+    n = len(points)
+    M = n // 2
+    if n == 0:
+        return (0, []) if with_order else 0
+    low = (1 << M) - 1
+    full = (1 << n) - 1
+
+    sr, sc = start
+    first = [abs(r - sr) + abs(c - sc) for r, c in points]
+    dist = [abs(r1 - r2) + abs(c1 - c2) for r1, c1 in points for r2, c2 in points]
+
+    best = array('i', [UNREACHED]) * ((full + 1) * n)
+    parent = array('b', [-1]) * ((full + 1) * n) if with_order else None
+    for j in range(M):      # 처음에는 몬스터만 갈 수 있다
+        best[(1 << j) * n + j] = first[j]
+
+    for mask in range(1, full):
+        ready = ~mask & full & (low | (mask & low) << M)
+        if not ready:
+            continue
+        base = mask * n
+        for last in range(n):
+            d = best[base + last]
+            if d == UNREACHED:
+                continue
+            row = last * n
+            bits = ready
+            while bits:
+                bit = bits & -bits
+                bits ^= bit
+                j = bit.bit_length() - 1
+                k = (mask | bit) * n + j
+                x = d + dist[row + j]
+                if x < best[k]:
+                    best[k] = x
+                    if parent is not None:
+                        parent[k] = last
+
+    base = full * n
+    last = min(range(n), key=lambda j: best[base + j])
+    total = best[base + last]
+    if not with_order:
+        return total
+
+    order = []
+    mask = full
+    while last >= 0:
+        order.append(last + 1 if last < M else M - last - 1)
+        prev = parent[mask * n + last]
+        mask ^= 1 << last
+        last = prev
+    order.reverse()
+    return total, order
+
+
+def main() -> None:
+    reader = FastReader.from_stdin()
+    T = reader.int()
+    out = []
+    for tc in range(1, T + 1):
+        N = reader.int()
+        board = [reader.ints() for _ in range(N)]
+        out.append(f'#{tc} {shortest_route(locate(board))}')
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    main()
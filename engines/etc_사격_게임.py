@@ -0,0 +1,102 @@
+"""etc-사격_게임: "구간에서 마지막으로 쏘는 풍선" 구간 DP.
+
+구간 [i, j] 의 풍선을 모두 쏘는 동안 바깥 이웃 i−1, j+1 은 아직 남아 있다고 보면,
+구간에서 마지막으로 쏘는 풍선 k 의 점수는 k 와 상관없이 바깥 이웃만으로 정해진다.
+
+- 양쪽 이웃이 있음: arr[i−1] * arr[j+1]
+- 한쪽만 있음: 그 이웃 값
+- 둘 다 없음(전체 구간의 마지막 풍선): 자기 자신 arr[k]
+
+따라서 ``best(i, j) = 점수(i, j) + max_k(best(i, k−1) + best(k+1, j))`` 이고 O(N³) 이다.
+행 방향 표와 열 방향 표를 따로 둔 ``array('q')`` 라서 k 에 대한 합은 두 슬라이스의
+``map(add, ...)`` 한 번으로 계산한다. N=10 은 수십 µs, N=300 도 몇 초 안에 끝난다.
+"""
+
+from array import array
+from operator import add
+
+from judge.fastio import FastReader
+
+
+def solve(values: list[int]) -> tuple[int, list[int]]:
+    """(최대 점수, 쏘는 순서의 0-based 인덱스 목록)"""
+    N = len(values)
+    if N == 0:
+        return 0, []
+
+    # rows[i][j + 1] = best(i, j), cols[j + 1][i] = best(i, j), 빈 구간(j = i − 1)은 0
+    rows = [array('q', bytes(8 * (N + 1))) for _ in range(N + 1)]
+    cols = [array('q', bytes(8 * (N + 1))) for _ in range(N + 1)]
+    last = {}
+
+    for length in range(1, N + 1):
+        for i in range(N - length + 1):
+            j = i + length - 1
+            sums = list(map(add, rows[i][i:j + 1], cols[j + 1][i + 1:j + 2]))
+            if i > 0 and j < N - 1:
+                outer = values[i - 1] * values[j + 1]
+                split = max(sums)
+            elif i > 0:
+                outer = values[i - 1]
+                split = max(sums)
+            elif j < N - 1:
+                outer = values[j + 1]
+                split = max(sums)
+            else:
+                # 전체 구간: 마지막 풍선은 자기 점수
+                scored = [s + v for s, v in zip(sums, values)]
+                split, outer = max(scored), 0
+                sums = scored
+            k = i + sums.index(split)
+            rows[i][j + 1] = cols[j + 1][i] = outer + split
+            last[i, j] = k
+
+    order = []
+    stack = [(0, N - 1, False)]
+    while stack:
+        i, j, ready = stack.pop()
+        if i > j:
+            continue
+        k = last[i, j]
+        if ready:
+            order.append(k)
+            continue
+        # 왼쪽 구간, 오른쪽 구간을 먼저 다 쏘고 k 를 마지막에
+        stack.append((i, j, True))
+        stack.append((k + 1, j, False))
+        stack.append((i, k - 1, False))
+    return rows[0][N], order
+
+
+def score_order(values: list[int], order: list[int]) -> int:
+    """순서대로 쐈을 때의 점수 (순서 검증용)"""
+    alive = list(range(len(values)))
+    total = 0
+    for k in order:
+        pos = alive.index(k)
+        has_left, has_right = pos > 0, pos < len(alive) - 1
+        if has_left and has_right:
+            total += values[alive[pos - 1]] * values[alive[pos + 1]]
+        elif has_left:
+            total += values[alive[pos - 1]]
+        elif has_right:
+            total += values[alive[pos + 1]]
+        else:
+            total += values[k]
+        alive.pop(pos)
+    return total
+
+
+def main() -> None:
+    reader = FastReader.from_stdin()
+    T = reader.int()
+    out = []
+    for tc in range(1, T + 1):
+        reader.int()
+        score, _ = solve(reader.ints())
+        out.append(f'#{tc} {score}')
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    main()
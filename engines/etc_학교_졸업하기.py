@@ -0,0 +1,33 @@
+"""etc-학교_졸업하기: ``engines.toposort`` 의 Kahn 스케줄러로 학기 수를 구한다.
+
+한 학기에 들을 수 있는 과목은 모두 듣고, 선수과목은 이전 학기까지 끝내야 하므로
+과목의 학기는 선수과목 사슬의 가장 긴 길이(레벨)다. 순환이 있으면 -1.
+"""
+
+from judge.fastio import FastReader
+
+from .toposort import schedule
+
+
+def semesters(prerequisites: list[list[int]]) -> int:
+    """prerequisites[x − 1] 은 과목 x 의 선수과목 번호 목록. 필요한 학기 수, 불가능하면 -1"""
+    edges = []
+    for x, before in enumerate(prerequisites, 1):
+        for p in before:
+            edges += (p, x)
+    return schedule(len(prerequisites), edges).depth
+
+
+def main() -> None:
+    reader = FastReader.from_stdin()
+    T = reader.int()
+    out = []
+    for tc in range(1, T + 1):
+        N = reader.int()
+        prerequisites = [reader.ints()[1:] for _ in range(N)]
+        out.append(f'#{tc} {semesters(prerequisites)}')
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""회문 색인 (Manacher). swea-1215, swea-1216, swea-1989 가 함께 쓴다.
+
+문자 사이사이에 구분 문자를 끼운 ``|a|b|a|`` 에서 중심마다 가장 긴 회문 반지름을 O(n) 에 구한다.
+이 반지름은 원래 문자열에서 그 중심의 가장 긴 회문 길이와 같고, 문자 중심이면 홀수, 틈 중심이면 짝수다.
+한 중심의 가장 긴 회문이 길이 L 이면 L, L − 2, ... 길이 회문도 모두 있으므로
+
+- 가장 긴 회문 = 반지름의 최댓값
+- 길이 k 회문 수 = 반지름이 k 이상이고 k 와 홀짝이 같은 중심 수
+
+이다. ``PalindromeIndex`` 는 줄마다 반지름 히스토그램을 모아 두고 뒤에서부터 2 칸씩 누적해서
+모든 k 의 개수를 한 번에 만든다. 판은 행과 (전치한) 열을 줄로 넣으므로 N×N 판 전체가 O(N²) 이다.
+"""
+
+from array import array
+
+from judge.fastio import FastReader
+
+_GAP = '\0'
+
+
+def radii(s: str) -> array:
+    """``_GAP`` 을 끼운 길이 2n + 1 문자열의 중심별 가장 긴 회문 길이 (원래 문자열 기준)"""
+    t = _GAP + _GAP.join(s) + _GAP
+    n = len(t)
+    p = array('i', bytes(4 * n))
+    center = right = 0
+    for i in range(n):
+        k = min(right - i, p[2 * center - i]) if i < right else 0
+        lo, hi = i - k - 1, i + k + 1
+        while lo >= 0 and hi < n and t[lo] == t[hi]:
+            lo -= 1
+            hi += 1
+        k = hi - i - 1
+        p[i] = k
+        if i + k > right:
+            center, right = i, i + k
+    return p
+
+
+def is_palindrome(s: str) -> bool:
+    return radii(s)[len(s)] == len(s)
+
+
+class PalindromeIndex:
+    def __init__(self, lines=()):
+        self.histogram = array('i')     # histogram[L]: 가장 긴 회문 길이가 L 인 중심 수
+        self._counts = None
+        for line in lines:
+            self.add(line)
+
+    @classmethod
+    def of_board(cls, board: list[str]) -> 'PalindromeIndex':
+        """행과 열을 모두 줄로 넣은 색인"""
+        return cls([*board, *map(''.join, zip(*board))])
+
+    def add(self, line: str) -> None:
+        histogram = self.histogram
+        if len(histogram) <= len(line):
+            histogram.extend(bytes(4 * (len(line) + 1 - len(histogram))))
+        for length in radii(line):
+            histogram[length] += 1
+        self._counts = None
+
+    def longest(self) -> int:
+        for length in range(len(self.histogram) - 1, 0, -1):
+            if self.histogram[length]:
+                return length
+        return 0
+
+    def counts(self) -> array:
+        """counts[k]: 길이 k 회문(위치가 다르면 따로) 수, k ≥ 1"""
+        if self._counts is None:
+            counts = array('i', self.histogram)
+            for k in range(len(counts) - 3, -1, -1):
+                counts[k] += counts[k + 2]
+            self._counts = counts
+        return self._counts
+
+    def count(self, k: int) -> int:
+        counts = self.counts()
+        return counts[k] if 0 < k < len(counts) else 0
+
+
+def read_board(reader: FastReader) -> list[str]:
+    """정사각 판 하나. 첫 줄의 길이가 판의 크기다."""
+    first = reader.input()
+    return [first] + [reader.input() for _ in range(len(first) - 1)]
+
+
+def index_boards(boards: list[list[str]]) -> list[PalindromeIndex]:
+    """테스트 판 여러 개를 한 번에 색인"""
+    return [PalindromeIndex.of_board(board) for board in boards]
@@ -0,0 +1,24 @@
+"""swea-1215 회문1: ``engines.palindrome`` 색인으로 판 전체의 길이 k 회문 수를 센다.
+
+테스트 케이스는 10개로 고정이고, 각 케이스는 찾을 길이 한 줄과 정사각 판(기본 8×8)이다.
+"""
+
+from judge.fastio import FastReader
+
+from .palindrome import index_boards, read_board
+
+T = 10
+
+
+def main() -> None:
+    reader = FastReader.from_stdin()
+    lengths, boards = [], []
+    for _ in range(T):
+        lengths.append(reader.int())
+        boards.append(read_board(reader))
+    out = [f'#{tc} {index.count(k)}' for tc, (k, index) in enumerate(zip(lengths, index_boards(boards)), 1)]
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+"""swea-1216 회문2: ``engines.palindrome`` 색인으로 판 전체의 가장 긴 회문 길이를 구한다.
+
+테스트 케이스는 10개로 고정이고, 각 케이스는 케이스 번호 한 줄과 정사각 판(기본 100×100)이다.
+출력에는 입력으로 받은 케이스 번호를 쓴다.
+"""
+
+from judge.fastio import FastReader
+
+from .palindrome import index_boards, read_board
+
+T = 10
+
+
+def main() -> None:
+    reader = FastReader.from_stdin()
+    numbers, boards = [], []
+    for _ in range(T):
+        numbers.append(reader.int())
+        boards.append(read_board(reader))
+    out = [f'#{tc} {index.longest()}' for tc, index in zip(numbers, index_boards(boards))]
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    main()
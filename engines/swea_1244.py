@@ -0,0 +1,52 @@
+"""swea-1244 최대 상금: 교환 횟수 단위 BFS + 단계별 중복 제거.
+
+숫자판을 문자열(불변, 해시 가능) 그대로 상태로 쓰고, 교환 횟수마다 한 단계씩 펼치며
+같은 단계에서 이미 본 배치는 버린다. 단계마다 상태는 많아야 n! (6자리면 720) 개다.
+
+교환 횟수가 자릿수 n 보다 많으면 줄인다. n 자리의 모든 배치는 n − 1 번 안에 만들 수 있고,
+남는 교환은 같은 쌍을 두 번 바꿔 두 번씩 버릴 수 있으므로, 패리티만 같으면
+``n − ((k − n) % 2)`` 번과 결과가 같다 (k = 교환 횟수). 6자리 × 10회도 6단계로 끝난다.
+"""
+
+from judge.fastio import FastReader
+
+
+def _swap(s: str, i: int, j: int) -> str:
+    return s[:i] + s[j] + s[i + 1:j] + s[i] + s[j + 1:]
+
+
+def levels(digits: str, swaps: int):
+    """교환 0회, 1회, ... swaps 회 후에 가능한 배치 집합을 차례로 낸다"""
+    n = len(digits)
+    pairs = [(i, j) for i in range(n) for j in range(i + 1, n)]
+    frontier = {digits}
+    yield frontier
+    for _ in range(swaps):
+        frontier = {_swap(s, i, j) for s in frontier for i, j in pairs}
+        yield frontier
+
+
+def solve(digits: str, swaps: int) -> int:
+    n = len(digits)
+    if n < 2:
+        return int(digits)
+    if swaps > n:
+        swaps = n - ((swaps - n) & 1)
+    for frontier in levels(digits, swaps):
+        pass
+    # 길이가 같은 숫자 문자열이므로 사전순 최대가 곧 최댓값
+    return int(max(frontier))
+
+
+def main() -> None:
+    reader = FastReader.from_stdin()
+    T = reader.int()
+    out = []
+    for tc in range(1, T + 1):
+        digits, swaps = reader.token(), reader.int()
+        out.append(f'#{tc} {solve(digits, swaps)}')
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    main()
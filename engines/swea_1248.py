@@ -0,0 +1,111 @@
+"""swea-1248 공통조상: 이진 올리기(binary lifting) LCA + 오일러 투어 서브트리 크기 색인.
+
+트리를 한 번 훑어(반복문, 재귀 없음) 다음을 모두 만든다.
+
+- ``order``: 전위 순회 순서, ``tin[v]`` 는 v 가 그 안에서 몇 번째인지(오일러 투어 진입 시각)
+- ``size[v]``: v 를 루트로 하는 서브트리 크기. v 의 서브트리는 ``order[tin[v]:tin[v] + size[v]]``
+  구간이라 "u 가 v 의 조상인가" 도 구간 비교 O(1) 이다
+- ``depth[v]``, ``up[k][v]``: v 의 2^k 번째 조상 (루트 위는 루트 자신)
+
+LCA 는 a 가 b 의 조상이 아닌 동안 큰 점프부터 올라가므로 O(log V), 서브트리 크기는 O(1) 이다.
+같은 트리에 질의가 여러 개면 ``TreeIndex`` 하나로 모두 답한다. 표는 모두 평탄 ``array('i')``.
+"""
+
+from array import array
+
+from judge.fastio import FastReader
+
+
+class TreeIndex:
+    def __init__(self, V: int, edges: list[int], root: int | None = None):
+        """정점 1..V, edges 는 ``부모 자식 부모 자식 ...`` 평탄 목록. root 가 없으면 부모가 없는 정점"""
+        parent = array('i', bytes(4 * (V + 1)))
+        head = array('i', bytes(4 * (V + 1)))       # 자식 연결 리스트: head[v] -> 첫 자식
+        sibling = array('i', bytes(4 * (V + 1)))    # sibling[c] -> 다음 형제
+        for i in range(0, len(edges), 2):
+            p, c = edges[i], edges[i + 1]
+            parent[c] = p
+            sibling[c] = head[p]
+            head[p] = c
+        if root is None:
+            root = next(v for v in range(1, V + 1) if not parent[v])
+        parent[root] = root
+        self.root = root
+
+        depth = array('i', bytes(4 * (V + 1)))
+        order = array('i')
+        stack = [root]
+        while stack:
+            v = stack.pop()
+            order.append(v)
+            c = head[v]
+            d = depth[v] + 1
+            while c:
+                depth[c] = d
+                stack.append(c)
+                c = sibling[c]
+
+        tin = array('i', bytes(4 * (V + 1)))
+        for i, v in enumerate(order):
+            tin[v] = i
+        size = array('i', [1]) * (V + 1)
+        for i in range(len(order) - 1, 0, -1):     # 전위 순서의 역순이면 자식이 부모보다 먼저
+            v = order[i]
+            size[parent[v]] += size[v]
+
+        up = [parent]
+        for _ in range(max(1, (max(depth) if depth else 0).bit_length()) - 1):
+            prev = up[-1]
+            up.append(array('i', [prev[prev[v]] for v in range(V + 1)]))
+
+        self.parent = parent
+        self.depth = depth
+        self.order = order
+        self.tin = tin
+        self.size = size
+        self.up = up
+
+    def is_ancestor(self, u: int, v: int) -> bool:
+        """u 가 v 의 조상이거나 v 자신인가"""
+        t = self.tin[u]
+        return t <= self.tin[v] < t + self.size[u]
+
+    def lca(self, a: int, b: int) -> int:
+        if self.is_ancestor(a, b):
+            return a
+        if self.is_ancestor(b, a):
+            return b
+        tin, size = self.tin, self.size
+        tb = tin[b]
+        for table in reversed(self.up):
+            u = table[a]
+            t = tin[u]
+            if not t <= tb < t + size[u]:
+                a = u
+        return self.parent[a]
+
+    def subtree(self, v: int) -> list[int]:
+        """v 의 서브트리 정점들 (전위 순서)"""
+        t = self.tin[v]
+        return self.order[t:t + self.size[v]].tolist()
+
+    def query(self, a: int, b: int) -> tuple[int, int]:
+        """(공통 조상, 그 서브트리 크기)"""
+        v = self.lca(a, b)
+        return v, self.size[v]
+
+
+def main() -> None:
+    reader = FastReader.from_stdin()
+    T = reader.int()
+    out = []
+    for tc in range(1, T + 1):
+        V, E, a, b = reader.ints()
+        index = TreeIndex(V, reader.ints())
+        v, size = index.query(a, b)
+        out.append(f'#{tc} {v} {size}')
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""swea-1249 보급로: 칸 비용 0~9 격자의 최단 경로 (Dial 버킷 큐 / heapq 다익스트라).
+
+격자는 테두리에 한 칸씩 벽을 두른 평탄 배열이다. 이웃은 ``u ± 1``, ``u ± W`` 이고
+벽 칸의 거리를 -1 로 미리 채워 두어 경계 검사 없이 ``nd < dist[v]`` 하나로 걸러진다.
+
+- ``dial``: 간선 가중치가 0~9 이므로 거리 ``% 10`` 으로 도는 버킷 10개면 충분하다.
+  큐 기반 BFS 처럼 같은 칸을 여러 번 다시 넣는 일이 없고 힙 연산도 없다.
+- ``dijkstra``: heapq 기반, 비용 범위가 넓어져도 그대로 쓸 수 있는 기준 구현.
+
+거리는 출발 칸을 포함한 경로 위 칸 비용의 합이다 (원래 풀이와 같은 정의).
+``with_path=True`` 이면 (거리, [(r, c), ...]) 를 돌려준다. 1000×1000 격자까지 쓴다.
+"""
+
+import heapq
+from array import array
+
+from judge.fastio import FastReader
+
+METHODS = ('dial', 'dijkstra')
+MAX_COST = 9
+_DIGITS = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+
+def _pad(rows: list[bytes]) -> tuple[bytes, int]:
+    """비용 행들을 벽을 두른 평탄 bytes 로, (평탄 격자, 폭 W)"""
+    W = len(rows[0]) + 2
+    wall = bytes(W)
+    return wall + b''.join(b'\0' + row + b'\0' for row in rows) + wall, W
+
+
+def _dist_array(size: int, W: int, H: int, inf: int) -> array:
+    dist = array('i', [inf]) * size
+    for c in range(W):
+        dist[c] = dist[size - W + c] = -1
+    for r in range(1, H + 1):
+        dist[r * W] = dist[r * W + W - 1] = -1
+    return dist
+
+
+def _dial(cost: bytes, dist: array, parent: array | None, W: int, source: int, target: int) -> int:
+    buckets = [[] for _ in range(MAX_COST + 1)]
+    dist[source] = cost[source]
+    buckets[cost[source] % (MAX_COST + 1)].append(source)
+    pending = 1
+    d = cost[source]
+    while pending:
+        bucket = buckets[d % (MAX_COST + 1)]
+        while bucket:
+            u = bucket.pop()
+            pending -= 1
+            if dist[u] != d:
+                continue    # 이미 더 짧게 갱신된 항목
+            if u == target:
+                return d
+            for v in (u - W, u - 1, u + 1, u + W):
+                nd = d + cost[v]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    if parent is not None:
+                        parent[v] = u
+                    buckets[nd % (MAX_COST + 1)].append(v)
+                    pending += 1
+        d += 1
+    return dist[target]
+
+
+def _dijkstra(cost: bytes, dist: array, parent: array | None, W: int, source: int, target: int) -> int:
+    dist[source] = cost[source]
+    heap = [(cost[source], source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d != dist[u]:
+            continue
+        if u == target:
+            return d
+        for v in (u - W, u - 1, u + 1, u + W):
+            nd = d + cost[v]
+            if nd < dist[v]:
+                dist[v] = nd
+                if parent is not None:
+                    parent[v] = u
+                heapq.heappush(heap, (nd, v))
+    return dist[target]
+
+
+def shortest_path(
+    rows: list[bytes],
+    method: str = 'dial',
+    with_path: bool = False,
+    source: tuple[int, int] = (0, 0),
+    target: tuple[int, int] | None = None,
+):
+    """rows: 칸 비용(0~9)을 바이트 값으로 담은 행들 (``digits`` 참고)"""
+    if method not in METHODS:
+        raise ValueError(f'unknown method: {method} (expected one of {", ".join(METHODS)})')
+    H = len(rows)
+    cost, W = _pad(rows)
+    if target is None:
+        target = (H - 1, W - 3)
+    s = (source[0] + 1) * W + source[1] + 1
+    t = (target[0] + 1) * W + target[1] + 1
+
+    dist = _dist_array(len(cost), W, H, 0x7FFFFFFF)
+    parent = array('i', [-1]) * len(cost) if with_path else None
+    run = _dial if method == 'dial' else _dijkstra
+    distance = run(cost, dist, parent, W, s, t)
+    if not with_path:
+        return distance
+
+    path = []
+    u = t
+    while u != -1:
+        path.append((u // W - 1, u % W - 1))
+        u = parent[u]
+    path.reverse()
+    return distance, path
+
+
+def digits(line: str) -> bytes:
+    """``'0123'`` -> ``b'\\x00\\x01\\x02\\x03'``"""
+    return line.encode().translate(_DIGITS)
+
+
+def main(method: str = 'dial') -> None:
+    reader = FastReader.from_stdin()
+    T = reader.int()
+    out = []
+    for tc in range(1, T + 1):
+        N = reader.int()
+        rows = [digits(reader.token()) for _ in range(N)]
+        out.append(f'#{tc} {shortest_path(rows, method)}')
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,24 @@
+"""swea-1267 작업순서: ``engines.toposort`` 의 Kahn 스케줄러로 위상 순서를 낸다.
+
+테스트 케이스는 10개로 고정이고 개수 줄이 없다. 순서가 여러 개면 어느 것이든 정답이다.
+"""
+
+from judge.fastio import FastReader
+
+from .toposort import schedule
+
+T = 10
+
+
+def main() -> None:
+    reader = FastReader.from_stdin()
+    out = []
+    for tc in range(1, T + 1):
+        V, E = reader.ints()
+        order = schedule(V, reader.ints()).order
+        out.append(f'#{tc} {" ".join(map(str, order))}')
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""swea-1486 장훈이의 높은 선반: 큰 정수 비트셋 부분합.
+
+가능한 탑 높이 집합을 정수 하나의 비트로 둔다 (k 번 비트 = 높이 k 를 만들 수 있음).
+점원마다 ``reach |= reach << h`` 한 번이면 되고, "B 이상인 가장 낮은 높이" 는
+``reach >> B`` 의 최하위 비트(``x & -x``) 위치라 비트 검색 한 번이다.
+N 이 수백이어도 비트 수는 키 합만큼이라 그대로 쓸 수 있다.
+
+``method='dfs'`` 는 스터디 풀이와 같은 선택/비선택 DFS 에 미리 계산한 접미사 합으로
+가지치기를 O(1) 로 만든 버전이다 (키가 큰 점원부터, 지금까지 찾은 최선보다 높아지면 중단).
+"""
+
+from judge.fastio import FastReader
+
+METHODS = ('bitset', 'dfs')
+
+
+def _bitset(heights: list[int], B: int) -> int:
+    reach = 1
+    for h in heights:
+        reach |= reach << h
+    above = reach >> B
+    if not above:
+        raise ValueError(f'tower cannot reach {B}')
+    return B + (above & -above).bit_length() - 1
+
+
+def _dfs(heights: list[int], B: int) -> int:
+    heights = sorted(heights, reverse=True)
+    n = len(heights)
+    suffix = [0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        suffix[i] = suffix[i + 1] + heights[i]
+    if suffix[0] < B:
+        raise ValueError(f'tower cannot reach {B}')
+
+    best = suffix[0]
+    stack = [(0, 0)]
+    while stack:
+        i, total = stack.pop()
+        if total >= B:
+            if total < best:
+                best = total
+                if best == B:
+                    break
+            continue
+        if i == n or total + suffix[i] < B or total >= best:
+            continue
+        stack.append((i + 1, total))
+        if total + heights[i] < best:
+            stack.append((i + 1, total + heights[i]))
+    return best
+
+
+def min_height(heights: list[int], B: int, method: str = 'bitset') -> int:
+    """점원 일부를 쌓아 만든 B 이상의 탑 높이 중 가장 낮은 값"""
+    if method not in METHODS:
+        raise ValueError(f'unknown method: {method} (expected one of {", ".join(METHODS)})')
+    return (_bitset if method == 'bitset' else _dfs)(heights, B)
+
+
+def main(method: str = 'bitset') -> None:
+    reader = FastReader.from_stdin()
+    T = reader.int()
+    out = []
+    for tc in range(1, T + 1):
+        N, B = reader.ints()
+        out.append(f'#{tc} {min_height(reader.ints(), B, method) - B}')
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""swea-1767 프로세서 연결하기: 비트보드 + 메모이제이션 탐색.
+
+격자 전체를 정수 하나(``r * N + c`` 번째 비트)로 두고, 코어마다 네 방향 전선이
+차지하는 칸을 미리 ray 마스크로 만들어 둔다. 연결 가능 여부는 ``board & ray == 0``,
+전선 놓기는 ``board | ray`` 한 번이라 칸마다 쓰고 되돌리는 비용이 없다.
+
+- 가지치기: 남은 코어를 모두 가장 짧은 전선으로 연결한다고 가정한 상한이 현재 최선 이하이면 건너뜀
+- 메모: (코어 번호, 남은 코어들의 ray 와 겹치는 부분만 남긴 board) -> 남은 코어들의 최선 점수.
+  앞 코어들의 서로 다른 선택이 뒤 코어에 같은 영향을 주면 한 번만 계산한다.
+
+점수는 ``연결 수 * BIG - 전선 길이`` 로, 연결 수를 먼저 최대화하고 길이를 최소화한다.
+"""
+
+from functools import lru_cache
+
+from judge.fastio import FastReader
+
+# 위, 아래, 왼쪽, 오른쪽
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def _rays(N: int, r: int, c: int) -> list[tuple[int, int]]:
+    """(r, c) 에서 가장자리까지 네 방향 전선의 (마스크, 길이)"""
+    rays = []
+    for dr, dc in DIRECTIONS:
+        mask = length = 0
+        nr, nc = r + dr, c + dc
+        while 0 <= nr < N and 0 <= nc < N:
+            mask |= 1 << (nr * N + nc)
+            length += 1
+            nr += dr
+            nc += dc
+        rays.append((mask, length))
+    return rays
+
+
+def solve(grid: list[list[int]]) -> tuple[int, int]:
+    """(연결한 코어 수의 최댓값, 그때 전선 길이 합의 최솟값)"""
+    N = len(grid)
+    board = 0
+    inner = []
+    for r in range(N):
+        for c in range(N):
+            if grid[r][c]:
+                board |= 1 << (r * N + c)
+                if 0 < r < N - 1 and 0 < c < N - 1:
+                    inner.append((r, c))
+
+    # 다른 코어에 처음부터 막힌 방향은 버리고, 짧은 전선부터 시도하도록 정렬
+    options = []
+    for r, c in inner:
+        rays = [(mask, length) for mask, length in _rays(N, r, c) if not board & mask]
+        rays.sort(key=lambda ray: ray[1])
+        options.append(rays)
+    options = [rays for rays in options if rays]
+    M = len(options)
+    BIG = N * N + 1
+
+    # relevant[i]: i 번 이후 코어들의 ray 합집합, bound[i]: i 번 이후 점수 상한
+    relevant = [0] * (M + 1)
+    bound = [0] * (M + 1)
+    for i in range(M - 1, -1, -1):
+        union = 0
+        for mask, _ in options[i]:
+            union |= mask
+        relevant[i] = relevant[i + 1] | union
+        bound[i] = bound[i + 1] + BIG - options[i][0][1]
+
+    @lru_cache(maxsize=None)
+    def best(i: int, occupied: int) -> int:
+        if i == M:
+            return 0
+        best_score = best(i + 1, occupied & relevant[i + 1])
+        for mask, length in options[i]:
+            gain = BIG - length
+            if gain + bound[i + 1] <= best_score:
+                # 길이순 정렬이므로 이후 방향은 더 나쁘다
+                break
+            if not occupied & mask:
+                score = gain + best(i + 1, (occupied | mask) & relevant[i + 1])
+                if score > best_score:
+                    best_score = score
+        return best_score
+
+    score = best(0, board & relevant[0])
+    connected = (score + BIG - 1) // BIG
+    return connected, connected * BIG - score
+
+
+def main() -> None:
+    reader = FastReader.from_stdin()
+    T = reader.int()
+    out = []
+    for tc in range(1, T + 1):
+        N = reader.int()
+        grid = reader.int_grid(N)
+        connected, length = solve(grid)
+        out.append(f'#{tc} {connected} {length}')
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    main()
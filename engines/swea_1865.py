@@ -0,0 +1,80 @@
+"""swea-1865 동철이의 일 분배: visited 비트마스크 DP 배정 엔진.
+
+``best[mask]`` 는 앞에서부터 popcount(mask) 명의 직원에게 mask 의 일들을 나눠 줬을 때의
+최대 성공 확률이다. 마스크를 오름차순으로 훑으며 다음 직원에게 빈 일을 하나씩 붙이므로
+O(N·2^N) 이고, 순열 탐색처럼 확률 분포에 따라 느려지지 않는다.
+
+- 표는 평탄 ``array('d')`` 이고, 각 마스크에서 마지막으로 배정한 일을 ``array('b')`` 에 남겨
+  최적 배정(직원 -> 일)을 복원한다.
+- ``log_space=True`` 이면 확률 곱 대신 로그 합을 최대화한다. N 이 커져 곱이 언더플로할 때 쓴다.
+  확률 0 인 칸은 어느 방식에서든 후보에서 뺀다.
+"""
+
+import math
+import sys
+from array import array
+
+from judge.fastio import FastReader
+
+
+def assign(probabilities: list[list[float]], log_space: bool = False) -> tuple[float, list[int]]:
+    """(최대 성공 확률, 직원 i 가 맡을 일 번호 목록). probabilities 는 0~1.
+
+    모든 배정의 확률이 0 이면 (0.0, [])
+    """
+    N = len(probabilities)
+    if N == 0:
+        return 1.0, []
+    full = (1 << N) - 1
+
+    if log_space:
+        unreachable = -math.inf
+        start = 0.0
+        weights = [[(1 << j, j, math.log(p)) for j, p in enumerate(row) if p > 0] for row in probabilities]
+    else:
+        unreachable = 0.0
+        start = 1.0
+        weights = [[(1 << j, j, p) for j, p in enumerate(row) if p > 0] for row in probabilities]
+
+    best = array('d', [unreachable]) * (full + 1)
+    choice = array('b', [-1]) * (full + 1)
+    best[0] = start
+
+    for mask in range(full):
+        value = best[mask]
+        if value == unreachable:
+            continue
+        for bit, j, w in weights[mask.bit_count()]:
+            if mask & bit:
+                continue
+            nxt = mask | bit
+            candidate = value + w if log_space else value * w
+            if candidate > best[nxt]:
+                best[nxt] = candidate
+                choice[nxt] = j
+
+    if best[full] == unreachable:
+        return 0.0, []
+
+    tasks = [0] * N
+    mask = full
+    for i in range(N - 1, -1, -1):
+        j = choice[mask]
+        tasks[i] = j
+        mask ^= 1 << j
+    return (math.exp(best[full]) if log_space else best[full]), tasks
+
+
+def main() -> None:
+    reader = FastReader.from_stdin()
+    T = reader.int()
+    for tc in range(1, T + 1):
+        N = reader.int()
+        probabilities = [[p / 100 for p in reader.ints()] for _ in range(N)]
+        probability, _ = assign(probabilities)
+        # 테스트 케이스마다 바로 내보낸다
+        sys.stdout.write(f'#{tc} {probability * 100:.6f}\n')
+
+
+if __name__ == '__main__':
+    main()
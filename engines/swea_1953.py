@@ -0,0 +1,104 @@
+"""swea-1953 탈주범 검거: 방향 마스크 터널 격자의 깊이 제한 BFS.
+
+터널 1~7 을 4비트 방향 마스크(위 1, 오른쪽 2, 아래 4, 왼쪽 8)로 바꾸고, 벽을 두른
+평탄 bytearray 에 담는다. 칸 u 에서 방향 d 로 나갈 수 있으려면 ``mask[u] & d`` 이고
+이웃 v 가 반대 방향으로 열려 있어야(``mask[v] & OPPOSITE[d]``) 한다. 마스크별로
+(오프셋, 반대 방향 비트) 목록을 미리 만들어 두므로 칸마다 if 분기가 없다.
+
+방문 표시는 정수 배열에 BFS 마다 새 도장(stamp) 값을 찍는 방식이라, 같은 격자에서
+출발점을 바꿔 여러 번 돌려도 배열을 다시 비우지 않는다.
+
+BFS 한 번으로 단계별 새로 도달한 칸 수(히스토그램)를 구하므로 모든 L 의 답이 누적합이다.
+"""
+
+from array import array
+
+from judge.fastio import FastReader
+
+UP, RIGHT, DOWN, LEFT = 1, 2, 4, 8
+OPPOSITE = {UP: DOWN, RIGHT: LEFT, DOWN: UP, LEFT: RIGHT}
+
+# 터널 번호 -> 열린 방향
+TUNNELS = (
+    0,
+    UP | RIGHT | DOWN | LEFT,
+    UP | DOWN,
+    LEFT | RIGHT,
+    UP | RIGHT,
+    DOWN | RIGHT,
+    DOWN | LEFT,
+    UP | LEFT,
+)
+
+# 입력 줄의 숫자 문자 -> 방향 마스크 (공백을 지운 뒤 bytes.translate 한 번)
+_TEXT_TO_MASK = bytes.maketrans(b'01234567', bytes(TUNNELS))
+
+
+def _mask_row(row: str | list[int]) -> bytes:
+    if isinstance(row, str):
+        return ''.join(row.split()).encode().translate(_TEXT_TO_MASK)
+    return bytes(TUNNELS[t] for t in row)
+
+
+class PipeMaze:
+    def __init__(self, grid: list[str] | list[list[int]]):
+        """grid: 터널 번호 행들, 정수 목록이거나 ``'1 0 2 ...'`` 같은 입력 줄 그대로"""
+        rows = [_mask_row(row) for row in grid]
+        self.rows = len(rows)
+        self.cols = len(rows[0])
+        W = self.W = self.cols + 2
+        wall = bytes(W)
+        self.mask = bytearray(wall + b''.join(b'\0' + row + b'\0' for row in rows) + wall)
+
+        offsets = {UP: -W, RIGHT: 1, DOWN: W, LEFT: -1}
+        # 마스크(0~15) -> ((오프셋, 이웃이 열려 있어야 할 비트), ...)
+        self.steps = tuple(
+            tuple((offsets[d], OPPOSITE[d]) for d in (UP, RIGHT, DOWN, LEFT) if m & d)
+            for m in range(16)
+        )
+        self._seen = array('i', bytes(4 * len(self.mask)))
+        self._stamp = 0
+
+    def histogram(self, r: int, c: int, levels: int) -> list[int]:
+        """(r, c) 에서 시작해 k 단계 만에 처음 도달하는 칸 수, k = 0 .. levels - 1"""
+        start = (r + 1) * self.W + c + 1
+        if not self.mask[start] or levels <= 0:
+            return [0] * max(levels, 0)
+
+        self._stamp += 1
+        stamp, seen, mask, steps = self._stamp, self._seen, self.mask, self.steps
+        seen[start] = stamp
+        frontier = [start]
+        counts = [1]
+        while len(counts) < levels:
+            nxt = []
+            for u in frontier:
+                for offset, need in steps[mask[u]]:
+                    v = u + offset
+                    if mask[v] & need and seen[v] != stamp:
+                        seen[v] = stamp
+                        nxt.append(v)
+            if not nxt:
+                break
+            counts.append(len(nxt))
+            frontier = nxt
+        return counts + [0] * (levels - len(counts))
+
+    def reachable(self, r: int, c: int, hours: int) -> int:
+        """맨홀에 들어간 지 hours 시간 안에 있을 수 있는 칸 수 (첫 시간이 맨홀 칸)"""
+        return sum(self.histogram(r, c, hours))
+
+
+def main() -> None:
+    reader = FastReader.from_stdin()
+    T = reader.int()
+    out = []
+    for tc in range(1, T + 1):
+        N, M, R, C, L = reader.ints()
+        maze = PipeMaze([reader.input() for _ in range(N)])
+        out.append(f'#{tc} {maze.reachable(R, C, L)}')
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    main()
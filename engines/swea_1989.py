@@ -0,0 +1,21 @@
+"""swea-1989 초심자의 회문 검사: ``engines.palindrome`` 의 Manacher 반지름으로 단어 전체가 회문인지 본다.
+
+가운데 중심의 가장 긴 회문이 단어 길이와 같으면 회문이다.
+"""
+
+from judge.fastio import FastReader
+
+from .palindrome import is_palindrome
+
+
+def main() -> None:
+    reader = FastReader.from_stdin()
+    T = reader.int()
+    out = []
+    for tc in range(1, T + 1):
+        out.append(f'#{tc} {int(is_palindrome(reader.token()))}')
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""swea-2115 벌꿀채취: 창(window)별 최대 수익 표 + 행별 누적 최댓값.
+
+1. 가로 M 칸 창마다 최대 수익을 한 번만 구해 N×(N−M+1) 표에 둔다.
+   수익은 꿀 합이 C 이하인 부분집합의 제곱합 최댓값이며, 부분집합 합은 비트마스크 순서로
+   ``sums[mask] = sums[mask & (mask - 1)] + 최하위 비트 원소`` 처럼 하나씩 더해 2^M 번에 끝난다.
+   수익은 창 안 값의 다중집합에만 달려 있으므로 정렬한 튜플로 메모한다.
+2. 두 일꾼의 창 조합은
+   - 다른 행: 행별 최댓값 중 큰 두 개의 합
+   - 같은 행: 창 k 와, k − M 이하에서 시작하는 창들의 누적 최댓값의 합
+   이라 쌍을 모두 나열하지 않는다. 전체 O(N²·2^M).
+"""
+
+from functools import lru_cache
+
+from judge.fastio import FastReader
+
+
+@lru_cache(maxsize=None)
+def _profit(values: tuple[int, ...], capacity: int) -> int:
+    n = len(values)
+    sums = [0] * (1 << n)
+    squares = [0] * (1 << n)
+    best = 0
+    for mask in range(1, 1 << n):
+        low = mask & -mask
+        v = values[low.bit_length() - 1]
+        rest = mask ^ low
+        s = sums[mask] = sums[rest] + v
+        q = squares[mask] = squares[rest] + v * v
+        if s <= capacity and q > best:
+            best = q
+    return best
+
+
+def window_profit(values, capacity: int) -> int:
+    """꿀통 값들 중 합이 capacity 이하인 부분집합의 제곱합 최댓값"""
+    return _profit(tuple(sorted(values)), capacity)
+
+
+def profit_table(grid: list[list[int]], M: int, C: int) -> list[list[int]]:
+    return [[window_profit(row[j:j + M], C) for j in range(len(row) - M + 1)] for row in grid]
+
+
+def solve(grid: list[list[int]], M: int, C: int) -> int:
+    table = profit_table(grid, M, C)
+
+    best_pair_same_row = 0
+    row_best = []
+    for profits in table:
+        row_best.append(max(profits))
+        prefix = 0  # 현재 창과 겹치지 않는 앞쪽 창들의 최댓값
+        for k in range(M, len(profits)):
+            prefix = max(prefix, profits[k - M])
+            best_pair_same_row = max(best_pair_same_row, prefix + profits[k])
+
+    row_best.sort(reverse=True)
+    best_pair_rows = row_best[0] + row_best[1] if len(row_best) > 1 else 0
+    return max(best_pair_rows, best_pair_same_row)
+
+
+def main() -> None:
+    reader = FastReader.from_stdin()
+    T = reader.int()
+    out = []
+    for tc in range(1, T + 1):
+        N, M, C = reader.ints()
+        out.append(f'#{tc} {solve(reader.int_grid(N), M, C)}')
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    main()
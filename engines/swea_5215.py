@@ -0,0 +1,114 @@
+"""swea-5215 햄버거 다이어트: 칼로리 축 1차원 0/1 배낭 DP.
+
+``best[c]`` 는 칼로리 합이 c 이하인 조합의 최대 맛 점수다.
+재료 (맛 v, 칼로리 w) 마다 ``best[c] = max(best[c], best[c − w] + v)`` 를 큰 c 부터 제자리에서
+갱신하는 ``array('i')`` 한 줄짜리 표라 시간 O(N·L), 메모리 O(L) 이다.
+지금까지 재료 칼로리 합(reach) 위쪽 칸은 값이 평평하므로 reach 가 자랄 때에만 채운다.
+
+- ``with_items=True``: 재료마다 "이 칼로리에서 골랐는지" 를 bytearray 로 남겨(O(N·L) 바이트)
+  고른 재료 번호를 복원한다.
+- NumPy 가 있으면 L 이 클 때(``NUMPY_THRESHOLD`` 이상) 같은 갱신을 벡터 연산으로 한다.
+  ``use_numpy`` 로 강제하거나 끌 수 있다.
+"""
+
+from array import array
+
+from judge.fastio import FastReader
+
+try:
+    import numpy as np
+except ImportError:     # 선택 의존성
+    np = None
+
+NUMPY_THRESHOLD = 1 << 16
+
+
+def _rows_array(items: list[tuple[int, int]], limit: int, with_items: bool):
+    best = array('i', bytes(4 * (limit + 1)))
+    taken = []
+    reach = 0   # 지금까지 재료 칼로리 합, 이보다 큰 칸은 best[reach] 와 같으므로 아직 채우지 않는다
+    for v, w in items:
+        if w > limit:
+            if with_items:
+                taken.append(None)
+            continue
+        grown = min(limit, reach + w)
+        if grown > reach:
+            best[reach + 1:grown + 1] = array('i', [best[reach]]) * (grown - reach)
+            reach = grown
+        mark = bytearray(limit + 1) if with_items else None
+        # 큰 칼로리부터 거꾸로 갱신하면 같은 재료를 두 번 쓰지 않는다 (0/1 배낭)
+        for c in range(reach, w - 1, -1):
+            x = best[c - w] + v
+            if x > best[c]:
+                best[c] = x
+                if mark is not None:
+                    mark[c] = 1
+        if with_items:
+            taken.append(mark)
+    return best[reach], taken
+
+
+def _rows_numpy(items: list[tuple[int, int]], limit: int, with_items: bool):
+    best = np.zeros(limit + 1, dtype=np.int64)
+    taken = []
+    for v, w in items:
+        if w > limit:
+            if with_items:
+                taken.append(None)
+            continue
+        new = best.copy()
+        np.maximum(best[w:], best[:limit + 1 - w] + v, out=new[w:])
+        if with_items:
+            taken.append(new > best)
+        best = new
+    return int(best[limit]), taken
+
+
+def knapsack(
+    items: list[tuple[int, int]],
+    limit: int,
+    with_items: bool = False,
+    use_numpy: bool | None = None,
+):
+    """items: (맛, 칼로리) 목록. 최대 맛 점수, with_items 이면 (점수, 고른 재료 번호 목록)"""
+    if use_numpy is None:
+        use_numpy = np is not None and limit >= NUMPY_THRESHOLD
+    if use_numpy and np is None:
+        raise RuntimeError('numpy is not installed')
+
+    score, taken = (_rows_numpy if use_numpy else _rows_array)(items, limit, with_items)
+    if not with_items:
+        return score
+
+    # i 번째 재료까지의 칼로리 합 위쪽은 표가 평평하므로 복원 칸을 그 합으로 내려 읽는다
+    reach = []
+    total = 0
+    for _, w in items:
+        if w <= limit:
+            total = min(limit, total + w)
+        reach.append(total)
+    chosen = []
+    c = limit
+    for i in range(len(items) - 1, -1, -1):
+        c = min(c, reach[i])
+        if taken[i] is not None and taken[i][c]:
+            chosen.append(i)
+            c -= items[i][1]
+    chosen.reverse()
+    return score, chosen
+
+
+def main() -> None:
+    reader = FastReader.from_stdin()
+    T = reader.int()
+    out = []
+    for tc in range(1, T + 1):
+        N, L = reader.ints()
+        items = [tuple(reader.ints()) for _ in range(N)]
+        out.append(f'#{tc} {knapsack(items, L)}')
+    print('\n'.join(out))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""방향 그래프 위상 정렬 스케줄러 (Kahn). swea-1267, etc-학교_졸업하기 가 함께 쓴다.
+
+간선은 ``앞 뒤 앞 뒤 ...`` 평탄 목록으로 받아 ``head``/``link`` 연결 리스트(평탄 ``array('i')``)로
+나가는 간선을 묶고, 진입 차수도 ``array('i')`` 로 센다. 진입 차수가 0 이 된 정점만 큐에 넣으므로
+큐 멤버십 검사가 필요 없고 전체 O(V + E) 다.
+
+- ``order``: 위상 순서. 진입 차수 0 인 정점을 번호 순으로 먼저 넣고 FIFO 로 꺼낸다.
+- ``level[v]``: v 까지 가장 긴 경로의 정점 수 (선수과목이라면 v 를 듣는 학기).
+  FIFO 로 꺼내면 레벨이 줄지 않는 순서로 나오므로 꺼낸 순간 값이 확정된다.
+- 순환: 순환에 걸린 정점과 그 뒤쪽은 진입 차수가 0 이 되지 않으니 ``len(order) < V`` 로 정확히 안다.
+"""
+
+from array import array
+from dataclasses import dataclass
+
+
+@dataclass
+class Schedule:
+    order: list[int]    # 위상 순서 (순환이면 순환 앞쪽까지만)
+    level: array        # level[v], 순서에 못 든 정점은 0
+    vertices: int
+
+    @property
+    def acyclic(self) -> bool:
+        return len(self.order) == self.vertices
+
+    @property
+    def depth(self) -> int:
+        """가장 긴 경로의 정점 수 (필요한 학기 수), 순환이면 -1"""
+        if not self.acyclic:
+            return -1
+        return max(self.level) if self.vertices else 0
+
+
+def schedule(V: int, edges: list[int]) -> Schedule:
+    """정점 1..V, edges 는 ``u v u v ...`` (u 가 v 보다 먼저)"""
+    head = array('i', [-1]) * (V + 1)
+    target = edges[1::2]
+    link = array('i', [-1]) * len(target)
+    indegree = array('i', bytes(4 * (V + 1)))
+    for e, u in enumerate(edges[0::2]):
+        link[e] = head[u]
+        head[u] = e
+        indegree[target[e]] += 1
+
+    level = array('i', bytes(4 * (V + 1)))
+    order = [v for v in range(1, V + 1) if not indegree[v]]
+    for v in order:
+        level[v] = 1
+    i = 0
+    while i < len(order):   # order 자체를 FIFO 큐로 쓴다
+        u = order[i]
+        i += 1
+        nxt = level[u] + 1
+        e = head[u]
+        while e >= 0:
+            v = target[e]
+            d = indegree[v] - 1
+            indegree[v] = d
+            if not d:
+                level[v] = nxt      # 마지막 선행 정점이 레벨이 가장 큰 쪽이다
+                order.append(v)
+            e = link[e]
+    return Schedule(order, level, V)
@@ -0,0 +1,23 @@
+"""Soootudy 채점 도구.
+
+``{멤버ID}/{YY-MM-wN}/*.py`` 풀이를 공용 테스트 세트(``testcases/{baseName}/``)로
+일괄 채점한다. 사용법은 ``python -m judge --help`` 참고.
+"""
+
+from .batch import judge_all
+from .discovery import Solution, discover, group_by_problem
+from .runner import CaseResult, SolutionResult, Verdict, judge_solution
+from .testset import TestCase, load_cases
+
+__all__ = [
+    'CaseResult',
+    'Solution',
+    'SolutionResult',
+    'TestCase',
+    'Verdict',
+    'discover',
+    'group_by_problem',
+    'judge_all',
+    'judge_solution',
+    'load_cases',
+]
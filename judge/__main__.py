@@ -0,0 +1,107 @@
+"""python -m judge: 풀이 일괄 채점 CLI"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from .batch import judge_all
+from .discovery import discover
+from .profiling import profile_solution
+from .runner import Verdict
+from .sandbox import DEFAULT_LIMITS, Limits
+from .store import DEFAULT_STORE, ResultStore
+from .testset import DEFAULT_TESTS_DIR, load_cases
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m judge', description='풀이 일괄 채점')
+    parser.add_argument('--root', type=Path, default=Path('.'), help='저장소 루트 (members.json 위치)')
+    parser.add_argument('--tests', type=Path, default=None, help=f'테스트 세트 폴더 (기본: ROOT/{DEFAULT_TESTS_DIR})')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='워커 프로세스 수 (기본: CPU 수)')
+    parser.add_argument(
+        '--time-limit', type=float, metavar='SEC', default=DEFAULT_LIMITS.cpu,
+        help=f'케이스당 CPU 시간 제한 (기본: {DEFAULT_LIMITS.cpu:g})',
+    )
+    parser.add_argument(
+        '--memory-limit', type=int, metavar='MB', default=DEFAULT_LIMITS.memory,
+        help=f'케이스당 메모리 제한 (기본: {DEFAULT_LIMITS.memory})',
+    )
+    parser.add_argument(
+        '--no-limits', action='store_true',
+        help='fork/제한 없이 워커 안에서 바로 실행 (빠르지만 끝나지 않는 풀이가 채점을 멈출 수 있음)',
+    )
+    parser.add_argument(
+        '--store', type=Path, nargs='?', const=DEFAULT_STORE, default=None,
+        help=f'결과 저장소 경로, 바뀐 풀이/테스트만 다시 실행 (기본: {DEFAULT_STORE})',
+    )
+    parser.add_argument('--member', action='append', help='특정 멤버만 (여러 번 지정 가능)')
+    parser.add_argument('--problem', action='append', help='특정 baseName 만 (예: swea-1767)')
+    parser.add_argument('--profile', type=Path, metavar='DIR', help='채점 대신 프로파일링, 보고서를 DIR 에 저장')
+    parser.add_argument('--lines', action='store_true', help='--profile 에 줄 단위 시간 추가 (느림)')
+    parser.add_argument('--memory', action='store_true', help='--profile 에 tracemalloc 할당 위치 추가')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON 으로 출력')
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    tests_dir = args.tests or args.root / DEFAULT_TESTS_DIR
+
+    solutions = discover(args.root)
+    if args.member:
+        solutions = [s for s in solutions if s.member in args.member]
+    if args.problem:
+        solutions = [s for s in solutions if s.base_name in args.problem]
+
+    if args.profile:
+        for s in solutions:
+            cases = load_cases(tests_dir, s.base_name)
+            if cases:
+                print(profile_solution(s, cases, args.profile, lines=args.lines, memory=args.memory))
+        return 0
+
+    limits = None if args.no_limits else Limits(cpu=args.time_limit, memory=args.memory_limit)
+
+    store = ResultStore(args.root / args.store) if args.store else None
+    start = time.perf_counter()
+    try:
+        results = judge_all(solutions, tests_dir, jobs=args.jobs, store=store, limits=limits)
+    finally:
+        if store is not None:
+            store.close()
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        json.dump([
+            {
+                'id': r.solution_id,
+                'verdict': r.verdict.value,
+                'elapsed': r.elapsed,
+                'memory': r.memory,
+                'cases': [
+                    {
+                        'name': c.name, 'verdict': c.verdict.value, 'elapsed': c.elapsed,
+                        'memory': c.memory, 'detail': c.detail, 'cached': c.cached,
+                    }
+                    for c in r.cases
+                ],
+            }
+            for r in results
+        ], sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        for r in results:
+            passed = sum(c.verdict in (Verdict.AC, Verdict.OK) for c in r.cases)
+            memory = f'{r.memory / 1024:7.1f}MB' if r.memory is not None else ' ' * 9
+            print(f'{r.verdict.value:<3} {passed:>3}/{len(r.cases):<3} {r.elapsed * 1000:9.1f}ms {memory}  {r.solution_id}')
+        cached = sum(c.cached for r in results for c in r.cases)
+        total = sum(len(r.cases) for r in results)
+        print(f'-- 풀이 {len(solutions)}개 중 {len(results)}개 채점 (케이스 {total}건, 캐시 {cached}건), {elapsed:.2f}s', file=sys.stderr)
+
+    return 0 if all(r.verdict in (Verdict.AC, Verdict.OK) for r in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
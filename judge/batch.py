@@ -0,0 +1,113 @@
+"""전체 트리 일괄 채점: 풀이 단위로 프로세스 풀에 분배한다."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+from .discovery import Solution, blob_sha
+from .forkserver import WarmPool, warm_up
+from .runner import CaseResult, SolutionResult, Verdict, judge_solution
+from .sandbox import DEFAULT_LIMITS, Limits
+from .store import ResultStore
+from .testset import load_cases
+
+
+@lru_cache(maxsize=None)
+def _cached_cases(tests_dir: str, base_name: str):
+    # 워커마다 문제별 테스트를 한 번만 읽는다 (작업마다 피클링하지 않음)
+    return load_cases(Path(tests_dir), base_name)
+
+
+def _judge_one(args: tuple[Solution, str, list[int]]) -> list[CaseResult]:
+    solution, tests_dir, indices = args
+    cases = _cached_cases(tests_dir, solution.base_name)
+    return judge_solution(solution, [cases[i] for i in indices]).cases
+
+
+def judge_all(
+    solutions: list[Solution],
+    tests_dir: Path,
+    jobs: int | None = None,
+    store: ResultStore | None = None,
+    limits: Limits | None = DEFAULT_LIMITS,
+) -> list[SolutionResult]:
+    """테스트 세트가 있는 풀이만 채점해 입력 순서대로 결과를 돌려준다
+
+    기본은 WarmPool 에서 (풀이, 테스트 케이스)마다 자식을 fork 해 limits 의 CPU 시간/메모리
+    제한을 걸고 격리 실행하므로, 끝나지 않는 풀이 하나가 일괄 채점을 멈추지 못한다.
+    limits=None 이면 제한 없이 워커 프로세스 안에서 바로 실행한다 (빠르지만 믿을 수 있는 풀이에만).
+    store 가 있으면 내용이 바뀌지 않은 (풀이, 테스트 케이스)는 실행하지 않고 저장된 결과를 쓴다.
+    저장된 판정은 어떤 제한으로 돌렸는지와 무관하므로, limits 가 있으면 저장된 시간/메모리가
+    그 제한 안일 때만 쓰고 아니면 다시 실행한다. TLE/MLE 는 제한 값 자체에 달린 판정이라 저장하지 않는다.
+    """
+    tests_dir = str(tests_dir)
+    targets = [s for s in solutions if _cached_cases(tests_dir, s.base_name)]
+    if not targets:
+        return []
+
+    results = {s.id: [None] * len(_cached_cases(tests_dir, s.base_name)) for s in targets}
+    shas = {}
+    todo = []
+    for s in targets:
+        cases = _cached_cases(tests_dir, s.base_name)
+        indices = list(range(len(cases)))
+        if store is not None:
+            shas[s.id] = sha = blob_sha(s.path.read_bytes())
+            for i, case in enumerate(cases):
+                hit = store.lookup(sha, case)
+                results[s.id][i] = hit if hit is None or _within(hit, limits) else None
+            indices = [i for i in indices if results[s.id][i] is None]
+        if indices:
+            todo.append((s, indices))
+
+    for (s, indices), case_results in zip(todo, _run(todo, tests_dir, jobs, limits)):
+        for i, case_result in zip(indices, case_results):
+            results[s.id][i] = case_result
+
+    if store is not None:
+        store.save([
+            (shas[s.id], _cached_cases(tests_dir, s.base_name)[i], results[s.id][i])
+            for s, indices in todo
+            for i in indices
+            if results[s.id][i].verdict not in (Verdict.TLE, Verdict.MLE)
+        ])
+
+    return [SolutionResult(s.id, results[s.id]) for s in targets]
+
+
+def _within(result: CaseResult, limits: Limits | None) -> bool:
+    """저장된 결과가 지금 제한으로 돌렸어도 같은 판정이었을지"""
+    if limits is None:
+        return True
+    if result.elapsed > limits.cpu:
+        return False
+    if limits.memory is not None:
+        # 제한 없이 프로세스 안에서 돌린 결과는 메모리를 재지 않았으므로 믿지 않는다
+        return result.memory is not None and result.memory < limits.memory * 1024 * 0.9
+    return True
+
+
+def _run(
+    todo: list[tuple[Solution, list[int]]],
+    tests_dir: str,
+    jobs: int | None,
+    limits: Limits | None,
+) -> list[list[CaseResult]]:
+    if not todo:
+        return []
+
+    jobs = jobs or os.cpu_count() or 1
+
+    if limits is not None:
+        with WarmPool(jobs, limits) as pool:
+            return pool.run(todo, Path(tests_dir))
+
+    work = [(s, tests_dir, indices) for s, indices in todo]
+
+    if jobs == 1:
+        return [_judge_one(args) for args in work]
+
+    chunksize = max(1, len(work) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=warm_up) as pool:
+        return list(pool.map(_judge_one, work, chunksize=chunksize))
@@ -0,0 +1,243 @@
+"""문제별 벤치마크: 같은 baseName 의 모든 풀이(멤버별, 버전별)를 같은 입력으로 비교한다.
+
+각 실행은 fork 한 자식에서 돌려 풀이끼리 상태가 섞이지 않게 하고(``sandbox.Limits`` 의
+CPU 시간/메모리 제한과 벽시계 마감을 건다), 여러 번 반복한 벽시계 시간의 중앙값으로 순위를 매긴다.
+정답 파일이 없는 케이스(``--generate`` 입력 포함)는 확인하지 못하므로 AC 가 아니라 OK 로 표시하고
+AC 뒤에 둔다.
+최대 RSS 는 아무것도 하지 않는 자식 대비 증가분, 할당량은 tracemalloc 최대치다.
+
+    python -m judge.bench --problem swea-4613 --repeat 7
+"""
+
+import argparse
+import os
+import pickle
+import signal
+import statistics
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .discovery import Solution, discover, group_by_problem
+from .forkserver import warm_up
+from .generators import GENERATORS, KINDS, generate
+from .inputcache import parsed
+from .runner import Verdict, check, compile_cached, execute
+from .sandbox import DEFAULT_LIMITS, Limits, apply_limits, read_with_deadline
+from .testset import DEFAULT_TESTS_DIR, TestCase, load_cases
+
+
+@dataclass
+class BenchResult:
+    solution_id: str
+    times: list[float] = field(default_factory=list)
+    peak_rss: int = 0           # KiB, 빈 자식 대비 증가분
+    peak_alloc: int = 0         # bytes, tracemalloc 최대치
+    verdict: str = Verdict.AC.value
+    detail: str | None = None
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times) if self.times else float('inf')
+
+    @property
+    def best(self) -> float:
+        return min(self.times) if self.times else float('inf')
+
+
+def _measure_child(code, case: TestCase, trace: bool) -> dict:
+    if trace:
+        tracemalloc.start()
+    run = execute(code, parsed(case.input))
+    stats = {'elapsed': run.elapsed, 'error': run.error}
+    if trace:
+        stats['peak_alloc'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    if run.error is None and case.expected is not None:
+        stats['correct'] = check(run.output, case.expected)
+    return stats
+
+
+def _forked(fn, *args, limits: Limits = DEFAULT_LIMITS) -> tuple[dict | None, int, str | None]:
+    """fn(*args) 를 제한을 건 자식에서 실행해 (결과, ru_maxrss KiB, 제한 초과 판정 또는 None)"""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            apply_limits(limits)
+            payload = pickle.dumps(fn(*args))
+            with os.fdopen(write_fd, 'wb') as w:
+                w.write(payload)
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    payload, finished = read_with_deadline(read_fd, limits.wall_limit)
+    os.close(read_fd)
+    if not finished:
+        os.kill(pid, signal.SIGKILL)
+    _, status, usage = os.wait4(pid, 0)
+
+    exceeded = None
+    if (
+        not finished
+        or usage.ru_utime + usage.ru_stime > limits.cpu
+        or (os.WIFSIGNALED(status) and os.WTERMSIG(status) == signal.SIGXCPU)
+    ):
+        exceeded = Verdict.TLE.value
+    result = pickle.loads(payload) if payload and finished else None
+    if result is not None and (result.get('error') or '').startswith('MemoryError'):
+        exceeded = Verdict.MLE.value
+    return result, usage.ru_maxrss, exceeded
+
+
+def _noop() -> dict:
+    return {}
+
+
+def bench_solution(
+    solution: Solution,
+    cases: list[TestCase],
+    repeat: int,
+    limits: Limits = DEFAULT_LIMITS,
+) -> BenchResult:
+    result = BenchResult(solution.id)
+    try:
+        _, code = compile_cached(solution.path)
+    except SyntaxError as e:
+        result.verdict, result.detail = Verdict.CE.value, str(e)
+        return result
+
+    for case in cases:
+        parsed(case.input)   # 자식마다 다시 파싱하지 않도록 부모에서 한 번
+    _, baseline_rss, _ = _forked(_noop, limits=limits)
+
+    for _ in range(repeat):
+        total = 0.0
+        for case in cases:
+            stats, rss, exceeded = _forked(_measure_child, code, case, False, limits=limits)
+            if exceeded is not None:
+                result.verdict = exceeded
+                result.detail = f'{case.name}: CPU {limits.cpu:g}s / {limits.memory}MB'
+                return result
+            if stats is None or stats['error'] is not None:
+                result.verdict = Verdict.RE.value
+                result.detail = stats['error'] if stats else 'child died'
+                return result
+            if stats.get('correct') is False:
+                result.verdict = Verdict.WA.value
+            total += stats['elapsed']
+            result.peak_rss = max(result.peak_rss, rss - baseline_rss)
+        result.times.append(total)
+
+    if result.verdict == Verdict.AC.value and any(case.expected is None for case in cases):
+        result.verdict = Verdict.OK.value
+
+    # 할당 측정은 느려지므로 시간 측정과 따로 한 번만
+    for case in cases:
+        stats, _, _ = _forked(_measure_child, code, case, True, limits=limits)
+        if stats is not None:
+            result.peak_alloc = max(result.peak_alloc, stats.get('peak_alloc', 0))
+
+    return result
+
+
+# 정렬 순서: 확인된 정답, 실행만 확인, 나머지
+_RANK = {Verdict.AC.value: 0, Verdict.OK.value: 1}
+
+
+def bench_problem(
+    solutions: list[Solution],
+    cases: list[TestCase],
+    repeat: int = 5,
+    limits: Limits = DEFAULT_LIMITS,
+) -> list[BenchResult]:
+    """중앙값 기준으로 정렬한 결과. 확인 못 한 풀이(OK)는 AC 뒤, 오답/에러는 맨 뒤로 보낸다."""
+    results = [bench_solution(s, cases, repeat, limits) for s in solutions]
+    results.sort(key=lambda r: (_RANK.get(r.verdict, 2), r.median))
+    return results
+
+
+def _fmt_time(seconds: float) -> str:
+    if seconds == float('inf'):
+        return '-'
+    if seconds < 1:
+        return f'{seconds * 1000:.2f}ms'
+    return f'{seconds:.2f}s'
+
+
+def _fmt_size(n: float) -> str:
+    for unit in ('B', 'KB', 'MB'):
+        if abs(n) < 1024:
+            return f'{n:.0f}{unit}'
+        n /= 1024
+    return f'{n:.1f}GB'
+
+
+def format_table(base_name: str, results: list[BenchResult], cases: int, repeat: int) -> str:
+    lines = [
+        f'{base_name} (입력 {cases}개, 반복 {repeat}회)',
+        f'{"순위":>4}  {"판정":<4} {"중앙값":>10} {"최소":>10} {"ΔRSS":>8} {"할당":>8}  풀이',
+    ]
+    for rank, r in enumerate(results, 1):
+        lines.append(
+            f'{rank:>4}  {r.verdict:<4} {_fmt_time(r.median):>10} {_fmt_time(r.best):>10} '
+            f'{_fmt_size(r.peak_rss * 1024):>8} {_fmt_size(r.peak_alloc):>8}  {r.solution_id}'
+        )
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m judge.bench', description='문제별 풀이 벤치마크')
+    parser.add_argument('--root', type=Path, default=Path('.'))
+    parser.add_argument('--tests', type=Path, default=None, help=f'테스트 세트 폴더 (기본: ROOT/{DEFAULT_TESTS_DIR})')
+    parser.add_argument('--problem', action='append', help='baseName (생략 시 풀이가 2개 이상인 모든 문제)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--generate', action='append', choices=KINDS,
+        help='테스트 세트 대신 생성기 입력 사용 (judge.generators 참고)',
+    )
+    parser.add_argument('--scale', type=int, default=1, help='--generate 배율')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--time-limit', type=float, metavar='SEC', default=DEFAULT_LIMITS.cpu,
+        help=f'실행당 CPU 시간 제한 (기본: {DEFAULT_LIMITS.cpu:g})',
+    )
+    parser.add_argument(
+        '--memory-limit', type=int, metavar='MB', default=DEFAULT_LIMITS.memory,
+        help=f'실행당 메모리 제한 (기본: {DEFAULT_LIMITS.memory})',
+    )
+    args = parser.parse_args(argv)
+    limits = Limits(cpu=args.time_limit, memory=args.memory_limit)
+
+    tests_dir = args.tests or args.root / DEFAULT_TESTS_DIR
+    groups = group_by_problem(discover(args.root))
+    if args.problem:
+        groups = {name: groups.get(name, []) for name in args.problem}
+    else:
+        groups = {name: group for name, group in groups.items() if len(group) > 1}
+
+    warm_up()
+    for base_name, solutions in sorted(groups.items()):
+        if args.generate:
+            if base_name not in GENERATORS:
+                continue
+            cases = [
+                TestCase(f'gen-{kind}-{args.scale}x', generate(base_name, kind, args.scale, args.seed), None)
+                for kind in args.generate
+            ]
+        else:
+            cases = load_cases(tests_dir, base_name)
+        if not cases or not solutions:
+            print(f'{base_name}: 입력 없음, 건너뜀', file=sys.stderr)
+            continue
+        results = bench_problem(solutions, cases, args.repeat, limits)
+        print(format_table(base_name, results, len(cases), args.repeat))
+        print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""스트리밍 출력 검사: 풀이의 stdout 자리에 끼워 출력이 나오는 대로 정답과 비교한다.
+
+출력 전체를 모아 두지 않고 줄이 끝날 때마다(한 줄이 아주 길면 ``CHUNK`` 마다) 토큰 단위로
+바로 맞춰 보며, 처음 틀린 토큰에서 ``WrongAnswer`` 를 올려 실행을 끊는다. ``#tc 답`` 한 줄을
+내보내자마자 검사하므로 틀린 ``#1`` 뒤에 오래 도는 풀이도 그 자리에서 멈춘다.
+공백 차이는 무시한다 (``runner.check`` 와 같은 기준).
+``WrongAnswer`` 는 ``BaseException`` 이라 풀이의 ``except Exception`` 에 잡히지 않는다.
+"""
+
+PREVIEW = 40
+CHUNK = 1 << 13     # 줄이 끝나지 않아도 이만큼 모이면 비교 (버퍼 상한)
+
+
+class WrongAnswer(BaseException):
+    pass
+
+
+def _preview(token: str) -> str:
+    return repr(token if len(token) <= PREVIEW else token[:PREVIEW] + '…')
+
+
+class StreamingChecker:
+    def __init__(self, expected: str):
+        self._expected = expected.split()
+        self._pos = 0
+        self._partial = ''      # 아직 공백으로 끝나지 않은 마지막 토큰 조각
+        self._pending: list[str] = []
+        self._size = 0
+        self.failure: str | None = None
+
+    def _case_label(self, index: int) -> str:
+        """index 번째 정답 토큰이 속한 ``#tc``"""
+        for i in range(min(index, len(self._expected) - 1), -1, -1):
+            if self._expected[i].startswith('#'):
+                return self._expected[i]
+        return '출력'
+
+    def _fail(self, detail: str):
+        self.failure = detail
+        raise WrongAnswer(detail)
+
+    def _match(self, tokens: list[str]) -> None:
+        expected, pos = self._expected, self._pos
+        end = pos + len(tokens)
+        if expected[pos:end] == tokens:
+            self._pos = end
+            return
+        for i, token in enumerate(tokens, pos):
+            if i >= len(expected):
+                self._fail(f'{self._case_label(i)}: 정답보다 긴 출력 {_preview(token)}')
+            if expected[i] != token:
+                self._fail(f'{self._case_label(i)}: 기대 {_preview(expected[i])}, 출력 {_preview(token)}')
+
+    def write(self, text: str) -> int:
+        if self.failure is not None:
+            # 풀이가 WrongAnswer 를 삼켜도 다시 끊는다
+            raise WrongAnswer(self.failure)
+        self._pending.append(text)
+        self._size += len(text)
+        # print 한 번이 write 를 여러 번 부르므로 조각마다가 아니라 줄 끝에서 비교한다
+        if '\n' in text or self._size >= CHUNK:
+            self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        chunk = self._partial + ''.join(self._pending)
+        self._pending.clear()
+        self._size = 0
+        tokens = chunk.split()
+        self._partial = tokens.pop() if tokens and chunk and not chunk[-1].isspace() else ''
+        if tokens:
+            self._match(tokens)
+
+    def finish(self) -> str | None:
+        """실행이 끝난 뒤 호출. 틀렸으면 사유, 맞으면 None"""
+        if self.failure is None:
+            try:
+                self.flush()
+            except WrongAnswer:
+                pass
+        if self.failure is None and self._partial:
+            partial, self._partial = self._partial, ''
+            try:
+                self._match([partial])
+            except WrongAnswer:
+                pass
+        if self.failure is None and self._pos < len(self._expected):
+            self.failure = f'{self._case_label(self._pos)}: 출력이 끝남, 기대 {_preview(self._expected[self._pos])}'
+        return self.failure
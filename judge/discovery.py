@@ -0,0 +1,102 @@
+"""풀이 파일 탐색.
+
+web/src/services/parser.ts 의 parseProblemsFromTree 와 같은 규칙을 따른다.
+
+- 경로는 정확히 ``{멤버ID}/{주차}/{파일명}.py`` 세 단계
+- 멤버ID는 members.json 에 등록된 키 (가상 멤버 ``_ref`` 포함)
+- 주차는 ``YY-MM-wN`` 형식
+- 파일명 끝의 ``-vN`` 은 버전, 나머지는 baseName
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+WEEK_PATTERN = re.compile(r'^\d{2}-\d{2}-w\d+$')
+VERSION_PATTERN = re.compile(r'^(.+)-v(\d+)$')
+
+
+@dataclass(frozen=True)
+class Solution:
+    id: str             # "lcj/26-03-w2/swea-1767-v1"
+    member: str
+    week: str
+    name: str           # 확장자를 뺀 파일명
+    base_name: str      # 버전 접미사를 뺀 문제 이름 ("swea-1767")
+    version: int | None
+    source: str         # 'swea' | 'boj' | 'etc'
+    path: Path
+
+
+def parse_source(filename: str) -> str:
+    lower = filename.lower()
+    if lower.startswith('swea-') or lower.startswith('swea_'):
+        return 'swea'
+    if lower.startswith('boj-') or lower.startswith('boj_'):
+        return 'boj'
+    return 'etc'
+
+
+def parse_version(name: str) -> tuple[str, int | None]:
+    match = VERSION_PATTERN.match(name)
+    if match:
+        return match.group(1), int(match.group(2))
+    return name, None
+
+
+def blob_sha(data: bytes) -> str:
+    """git blob SHA-1 (GitHub tree API 의 sha 와 같은 값)"""
+    return hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+
+
+def load_members(root: Path) -> dict:
+    with open(root / 'members.json', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def discover(root: Path, members: dict | None = None) -> list[Solution]:
+    """root 아래의 모든 풀이 파일을 parser.ts 와 같은 순서(주차 내림차순, 이름순)로 반환"""
+    root = Path(root)
+    if members is None:
+        members = load_members(root)
+
+    solutions = []
+    for member in members:
+        member_dir = root / member
+        if not member_dir.is_dir():
+            continue
+
+        for week_dir in member_dir.iterdir():
+            if not week_dir.is_dir() or not WEEK_PATTERN.match(week_dir.name):
+                continue
+
+            for path in week_dir.iterdir():
+                if not path.is_file() or path.suffix != '.py':
+                    continue
+
+                name = path.stem
+                base_name, version = parse_version(name)
+                solutions.append(Solution(
+                    id=f'{member}/{week_dir.name}/{name}',
+                    member=member,
+                    week=week_dir.name,
+                    name=name,
+                    base_name=base_name,
+                    version=version,
+                    source=parse_source(path.name),
+                    path=path,
+                ))
+
+    solutions.sort(key=lambda s: s.name)
+    solutions.sort(key=lambda s: s.week, reverse=True)
+    return solutions
+
+
+def group_by_problem(solutions: list[Solution]) -> dict[str, list[Solution]]:
+    """baseName 별로 묶기 (웹의 문제 페이지와 같은 단위)"""
+    groups: dict[str, list[Solution]] = {}
+    for solution in solutions:
+        groups.setdefault(solution.base_name, []).append(solution)
+    return groups
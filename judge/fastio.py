@@ -0,0 +1,142 @@
+"""빠른 입력: 표준 입력 전체를 한 번에 읽어 줄 목록으로 나눠 두고 차례로 꺼낸다.
+
+풀이들은 ``input()`` 과 ``list(map(int, input().split()))`` 로 줄마다 읽는다.
+내장 ``input()`` 은 호출마다 ``sys.stdout`` flush, ``sys.stdin.readline`` 조회 같은
+일을 해서 100×100 격자처럼 줄이 많은 입력에서는 토큰 분리보다 이쪽이 더 비싸다.
+``FastReader`` 는 입력을 ``splitlines()`` 한 번으로 나눠 두고 줄/토큰/정수 행/격자를 꺼낸다.
+
+채점기는 풀이마다 ``sys.stdin`` 을 ``FastReader`` 로, 전역 ``input`` 을 ``reader.input`` 으로
+바꿔 끼우므로 풀이 파일을 고치지 않아도 된다. 줄 단위/토큰 단위 읽기를 섞어도 위치는 하나다.
+
+    from judge.fastio import FastReader
+    reader = FastReader.from_stdin()
+    T = reader.int()
+    n, m = reader.ints()
+    grid = reader.digit_grid(n)
+"""
+
+import sys
+
+from .inputcache import ParsedInput
+
+# b'0'..b'9' -> 0..9, 한 자리 숫자 행을 list(bytes) 한 번으로 정수 목록으로 바꾼다
+_DIGITS = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+
+class _Buffer:
+    """``sys.stdin.buffer`` 자리: 같은 위치를 공유하는 bytes 읽기"""
+
+    def __init__(self, reader: 'FastReader'):
+        self._reader = reader
+
+    def read(self, size: int = -1) -> bytes:
+        return self._reader.read(size).encode()
+
+    def readline(self) -> bytes:
+        return self._reader.readline().encode()
+
+    def __iter__(self):
+        return iter(self.readline, b'')
+
+
+class FastReader:
+    def __init__(self, data: str | bytes | ParsedInput):
+        # ParsedInput 이면 이미 나눠 둔 줄 목록을 공유한다
+        if isinstance(data, ParsedInput):
+            self.lines = data.lines
+        else:
+            self.lines = (data.decode() if isinstance(data, bytes) else data).splitlines()
+        self.index = 0              # 다음에 읽을 줄
+        self._rest: list[str] = []  # 토큰 단위로 읽다 남은 현재 줄의 토큰 (역순)
+        self.buffer = _Buffer(self)
+
+    @classmethod
+    def from_stdin(cls) -> 'FastReader':
+        return cls(sys.stdin.buffer.read())
+
+    def _rest_of_line(self) -> str:
+        rest = ' '.join(reversed(self._rest))
+        self._rest = []
+        return rest
+
+    # --- 줄 단위 (input / sys.stdin 호환) ---
+
+    def input(self, prompt: str = '') -> str:
+        if self._rest:
+            return self._rest_of_line()
+        i = self.index
+        if i >= len(self.lines):
+            raise EOFError('EOF when reading a line')
+        self.index = i + 1
+        return self.lines[i]
+
+    def readline(self) -> str:
+        """입력 끝이면 ''"""
+        try:
+            return self.input() + '\n'
+        except EOFError:
+            return ''
+
+    def read(self, size: int = -1) -> str:
+        head = [self._rest_of_line()] if self._rest else []
+        text = '\n'.join(head + self.lines[self.index:])
+        if text:
+            text += '\n'
+        self.index = len(self.lines)
+        if size is not None and 0 <= size < len(text):
+            # 남은 부분은 다시 줄 목록으로 되돌린다
+            self.lines, self.index = text[size:].splitlines(), 0
+            text = text[:size]
+        return text
+
+    def readlines(self) -> list[str]:
+        return list(self)
+
+    def __iter__(self):
+        return iter(self.readline, '')
+
+    def isatty(self) -> bool:
+        return False
+
+    def close(self) -> None:
+        pass
+
+    # --- 토큰 단위 ---
+
+    def token(self) -> str:
+        while not self._rest:
+            i = self.index
+            if i >= len(self.lines):
+                raise EOFError('no more tokens')
+            self.index = i + 1
+            self._rest = self.lines[i].split()[::-1]
+        return self._rest.pop()
+
+    def int(self) -> int:
+        return int(self.token())
+
+    def tokens(self, n: int) -> list[str]:
+        return [self.token() for _ in range(n)]
+
+    def ints(self) -> list[int]:
+        """현재 줄의 남은 정수 전부 (빈 줄은 건너뜀)"""
+        if self._rest:
+            return list(map(int, self._rest_of_line().split()))
+        while True:
+            row = self.input().split()
+            if row:
+                return list(map(int, row))
+
+    # --- 격자 ---
+
+    def int_grid(self, n: int) -> list[list[int]]:
+        """공백으로 나뉜 정수 n 행"""
+        return [self.ints() for _ in range(n)]
+
+    def grid(self, n: int) -> list[str]:
+        """공백 없는 문자 격자 n 행"""
+        return [self.token() for _ in range(n)]
+
+    def digit_grid(self, n: int) -> list[list[int]]:
+        """``0101`` 처럼 붙어 있는 한 자리 숫자 n 행"""
+        return [list(self.token().encode().translate(_DIGITS)) for _ in range(n)]
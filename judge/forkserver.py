@@ -0,0 +1,161 @@
+"""미리 데워 둔 워커에서 (풀이, 테스트 케이스)마다 자식을 fork 해 실행하는 러너.
+
+풀이 대부분은 실행보다 인터프리터 기동과 ``collections``, ``itertools`` 같은 import 가
+더 오래 걸린다. 워커는 자주 쓰는 모듈을 import 해 둔 채 살아 있고, 작업이 오면
+컴파일 캐시(blob sha 기준)에서 코드를 꺼낸 뒤 ``os.fork()`` 한 자식에서 실행한다.
+자식은 매번 깨끗한 상태에서 시작하므로 전역 변수, 재귀 한도 등이 다음 실행에 새지 않는다.
+자식에는 ``sandbox.Limits`` 의 CPU 시간/메모리 제한이 걸린다.
+"""
+
+import gc
+import importlib
+import multiprocessing
+import os
+import pickle
+import signal
+import time
+from multiprocessing.connection import wait
+from pathlib import Path
+
+from .discovery import Solution
+from .inputcache import parsed
+from .runner import CaseResult, Verdict, compile_cached, judge_case
+from .sandbox import DEFAULT_LIMITS, Limits, apply_limits, classify, read_with_deadline, resident_memory
+from .testset import load_cases
+
+# 풀이들이 주로 쓰는 표준 모듈
+WARM_IMPORTS = (
+    'array', 'bisect', 'collections', 'copy', 'functools', 'heapq',
+    'itertools', 'math', 'operator', 're', 'string',
+)
+
+_cases_cache: dict[tuple[str, str], list] = {}
+
+
+def warm_up() -> None:
+    for name in WARM_IMPORTS:
+        importlib.import_module(name)
+    # fork 된 자식에서 GC 가 공유 페이지를 건드려 복사되지 않도록 현재 객체를 고정
+    gc.freeze()
+
+
+def _cases(tests_dir: str, base_name: str) -> list:
+    key = (tests_dir, base_name)
+    if key not in _cases_cache:
+        _cases_cache[key] = load_cases(Path(tests_dir), base_name)
+    return _cases_cache[key]
+
+
+def run_forked(path: str, tests_dir: str, base_name: str, index: int, limits: Limits = DEFAULT_LIMITS) -> CaseResult:
+    case = _cases(tests_dir, base_name)[index]
+    try:
+        _, code = compile_cached(Path(path))
+    except SyntaxError as e:
+        return CaseResult(case.name, Verdict.CE, detail=str(e))
+    # 자식이 아니라 워커에서 파싱해 두어야 다음 fork 에서도 재사용된다
+    parsed(case.input)
+
+    read_fd, write_fd = os.pipe()
+    # 자식의 ru_maxrss 에는 fork 로 물려받은 워커 메모리가 들어 있으므로 빼고 센다
+    baseline = resident_memory()
+    start = time.perf_counter()
+    pid = os.fork()
+    if pid == 0:
+        # 자식: 제한을 건 뒤 실행 결과를 파이프로 넘기고 정리 없이 바로 종료
+        os.close(read_fd)
+        try:
+            apply_limits(limits)
+            payload = pickle.dumps(judge_case(code, case))
+            with os.fdopen(write_fd, 'wb') as w:
+                w.write(payload)
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    payload, finished = read_with_deadline(read_fd, limits.wall_limit)
+    os.close(read_fd)
+    if not finished:
+        os.kill(pid, signal.SIGKILL)
+    _, status, usage = os.wait4(pid, 0)
+    elapsed = time.perf_counter() - start
+    peak = max(0, usage.ru_maxrss - baseline)
+
+    if not finished:
+        return CaseResult(case.name, Verdict.TLE, elapsed, f'wall {limits.wall_limit:g}s 초과', memory=peak)
+    # RLIMIT_CPU 는 정수 초라 올림해 걸었으므로, 소수 제한은 실제 사용량으로 다시 판정한다
+    cpu = usage.ru_utime + usage.ru_stime
+    if cpu > limits.cpu:
+        return CaseResult(case.name, Verdict.TLE, elapsed, f'CPU {cpu:.2f}s > {limits.cpu:g}s', memory=peak)
+    result = pickle.loads(payload) if payload else None
+    return classify(case.name, result, status, peak, elapsed, limits)
+
+
+def _serve(conn, limits: Limits) -> None:
+    warm_up()
+    while True:
+        job = conn.recv()
+        if job is None:
+            break
+        conn.send(run_forked(*job, limits))
+
+
+class WarmPool:
+    """작업을 쉬고 있는 워커에 하나씩 넘기는 fork 서버 풀"""
+
+    def __init__(self, workers: int | None = None, limits: Limits = DEFAULT_LIMITS):
+        ctx = multiprocessing.get_context('fork')
+        self._conns = []
+        self._procs = []
+        for _ in range(workers or os.cpu_count() or 1):
+            parent_conn, child_conn = ctx.Pipe()
+            proc = ctx.Process(target=_serve, args=(child_conn, limits), daemon=True)
+            proc.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._procs.append(proc)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        for conn in self._conns:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+        for proc in self._procs:
+            proc.join()
+        self._conns = []
+        self._procs = []
+
+    def map(self, jobs: list[tuple]) -> list:
+        """jobs 를 모두 실행해 입력 순서대로 결과를 돌려준다"""
+        results = [None] * len(jobs)
+        pending = iter(enumerate(jobs))
+        busy = {}
+
+        def dispatch(conn) -> None:
+            item = next(pending, None)
+            if item is not None:
+                busy[conn] = item[0]
+                conn.send(item[1])
+
+        for conn in self._conns:
+            dispatch(conn)
+
+        while busy:
+            for conn in wait(list(busy)):
+                results[busy.pop(conn)] = conn.recv()
+                dispatch(conn)
+
+        return results
+
+    def run(self, todo: list[tuple[Solution, list[int]]], tests_dir: Path) -> list[list[CaseResult]]:
+        """(풀이, 케이스 번호 목록)마다 결과 목록을 돌려준다"""
+        tests_dir = str(tests_dir)
+        jobs = [(str(s.path), tests_dir, s.base_name, i) for s, indices in todo for i in indices]
+        flat = iter(self.map(jobs))
+        return [[next(flat) for _ in indices] for _, indices in todo]
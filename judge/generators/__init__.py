@@ -0,0 +1,44 @@
+"""문제별 최대 제약 입력 생성기.
+
+생성기는 baseName 으로 등록되며 ``(rng, kind, scale) -> 입력 문자열`` 형태다.
+
+- kind: ``random`` (제약 범위 안의 무작위), ``worst`` (최대 크기에서 탐색량이 가장 많은 구조),
+  ``adversarial`` (흔한 가지치기/휴리스틱을 무력화하는 구조)
+- scale: 1, 10, 100 배 단계. 다항 시간 풀이가 있는 문제는 입력 크기(원소 수)를,
+  지수 시간 탐색 문제는 테스트 케이스 수를 늘린다. 어느 쪽인지는 생성기 docstring 참고.
+
+같은 (문제, kind, scale, seed) 는 항상 같은 입력을 만든다.
+"""
+
+import random
+from collections.abc import Callable
+
+KINDS = ('random', 'worst', 'adversarial')
+TIERS = (1, 10, 100)
+
+Generator = Callable[[random.Random, str, int], str]
+
+GENERATORS: dict[str, Generator] = {}
+
+
+def register(*base_names: str):
+    def decorator(fn: Generator) -> Generator:
+        for name in base_names:
+            GENERATORS[name] = fn
+        return fn
+    return decorator
+
+
+def generate(base_name: str, kind: str = 'random', scale: int = 1, seed: int = 0) -> str:
+    if kind not in KINDS:
+        raise ValueError(f'unknown kind: {kind} (expected one of {", ".join(KINDS)})')
+    try:
+        fn = GENERATORS[base_name]
+    except KeyError:
+        raise KeyError(f'no generator registered for {base_name}') from None
+    rng = random.Random(f'{base_name}/{kind}/{scale}/{seed}')
+    return fn(rng, kind, scale)
+
+
+# 등록은 import 시점에 일어난다
+from . import problems  # noqa: E402,F401
@@ -0,0 +1,50 @@
+"""python -m judge.generators: 입력 생성 CLI
+
+    python -m judge.generators swea-1767 --kind worst            # 표준 출력으로
+    python -m judge.generators --write --scale 1 10               # testcases/{baseName}/gen-*.in 으로
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from . import GENERATORS, KINDS, TIERS, generate
+from ..testset import DEFAULT_TESTS_DIR
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m judge.generators', description='최대 제약 입력 생성')
+    parser.add_argument('problem', nargs='*', help='baseName (생략 시 등록된 전체, --write 와 함께)')
+    parser.add_argument('--kind', action='append', choices=KINDS, help=f'기본: 전체 ({", ".join(KINDS)})')
+    parser.add_argument('--scale', type=int, nargs='+', default=[1], help=f'배율 단계 (예: {" ".join(map(str, TIERS))})')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--write', action='store_true', help='표준 출력 대신 테스트 세트 폴더에 .in 파일로 저장')
+    parser.add_argument('--tests', type=Path, default=Path(DEFAULT_TESTS_DIR))
+    parser.add_argument('--list', action='store_true', help='등록된 문제 목록')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print('\n'.join(sorted(GENERATORS)))
+        return 0
+
+    problems = args.problem or (sorted(GENERATORS) if args.write else [])
+    if not problems:
+        parser.error('문제를 지정하거나 --write 로 전체를 생성하세요')
+    kinds = args.kind or list(KINDS)
+
+    for base_name in problems:
+        for kind in kinds:
+            for scale in args.scale:
+                text = generate(base_name, kind, scale, args.seed)
+                if not args.write:
+                    sys.stdout.write(text)
+                    continue
+                path = args.tests / base_name / f'gen-{kind}-{scale}x.in'
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(text, encoding='utf-8')
+                print(f'{path} ({len(text):,} bytes)', file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
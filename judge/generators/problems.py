@@ -0,0 +1,565 @@
+"""문제별 생성기 등록.
+
+제약은 문제 원문(SWEA) 기준이며, 원문이 없는 etc- 문제는 풀이 주석에서 추정한 값이다.
+"""
+
+import math
+import random
+
+from . import register
+
+
+def _side(base: int, scale: int) -> int:
+    """2차원 격자는 원소 수가 scale 배가 되도록 한 변을 sqrt(scale) 배"""
+    return max(1, round(base * math.sqrt(scale)))
+
+
+def _row(values) -> str:
+    return ' '.join(map(str, values))
+
+
+def _join(lines) -> str:
+    return '\n'.join(map(str, lines)) + '\n'
+
+
+def _random_tree_edges(rng: random.Random, V: int, max_children: int = 2) -> list[tuple[int, int]]:
+    """1 번이 루트인 무작위 트리의 (부모, 자식) 간선, 노드당 자식 수 제한"""
+    open_nodes = [1]
+    children = [0] * (V + 1)
+    edges = []
+    for child in range(2, V + 1):
+        i = rng.randrange(len(open_nodes))
+        parent = open_nodes[i]
+        edges.append((parent, child))
+        children[parent] += 1
+        if children[parent] == max_children:
+            open_nodes[i] = open_nodes[-1]
+            open_nodes.pop()
+        open_nodes.append(child)
+    return edges
+
+
+# ---------------------------------------------------------------- 탐색 / 백트래킹
+# 지수 시간 탐색 문제: scale 은 테스트 케이스 수
+
+@register('swea-1767')
+def processor_wiring(rng: random.Random, kind: str, scale: int) -> str:
+    """N=12, 코어 최대 12개. worst: 행/열이 최대한 겹치지 않게 흩어 모든 방향이 열린 상태,
+    adversarial: 중앙에 뭉쳐 대부분 연결할 수 없어 코어 수 가지치기가 늦게 걸리는 상태"""
+    T = 10 * scale
+    lines = [T]
+    for _ in range(T):
+        N = 12 if kind != 'random' else rng.randint(7, 12)
+        grid = [[0] * N for _ in range(N)]
+        if kind == 'worst':
+            rows = list(range(1, N - 1)) + rng.sample(range(1, N - 1), 2)
+            cols = list(range(1, N - 1)) + rng.sample(range(1, N - 1), 2)
+            rng.shuffle(cols)
+            for r, c in set(zip(rows, cols)):
+                grid[r][c] = 1
+        elif kind == 'adversarial':
+            top = N // 2 - 2
+            for r in range(top, top + 4):
+                for c in range(top, top + 3):
+                    grid[r][c] = 1
+        else:
+            cells = [(r, c) for r in range(N) for c in range(N)]
+            for r, c in rng.sample(cells, rng.randint(1, 12)):
+                grid[r][c] = 1
+        lines.append(N)
+        lines.extend(_row(row) for row in grid)
+    return _join(lines)
+
+
+@register('swea-2115')
+def honey(rng: random.Random, kind: str, scale: int) -> str:
+    """N<=10, M<=5, C<=30, 꿀 1~9. adversarial 은 창 합이 항상 C 를 넘어 부분집합을 매번 따져야 하는 경우"""
+    T = 10 * scale
+    lines = [T]
+    for _ in range(T):
+        if kind == 'random':
+            N, M, C = rng.randint(3, 10), rng.randint(1, 5), rng.randint(10, 30)
+            low = 1
+        else:
+            N, M, C = 10, 5, 30 if kind == 'worst' else 29
+            low = 5 if kind == 'worst' else 7
+        M = min(M, N)
+        lines.append(_row((N, M, C)))
+        lines.extend(_row(rng.randint(low, 9) for _ in range(N)) for _ in range(N))
+    return _join(lines)
+
+
+@register('swea-1865')
+def assignment(rng: random.Random, kind: str, scale: int) -> str:
+    """N<=16, 확률 0~100. worst: 확률이 고르게 높아 가지치기가 약함,
+    adversarial: 모든 직원의 최고 확률이 같은 일에 몰려 탐욕 순서가 틀리는 경우"""
+    T = 10 * scale
+    lines = [T]
+    for _ in range(T):
+        N = 16 if kind != 'random' else rng.randint(1, 16)
+        if kind == 'worst':
+            grid = [[rng.randint(90, 100) for _ in range(N)] for _ in range(N)]
+        elif kind == 'adversarial':
+            hot = rng.randrange(N)
+            grid = [[100 if c == hot else rng.randint(95, 99) for c in range(N)] for _ in range(N)]
+        else:
+            grid = [[rng.randint(0, 100) for _ in range(N)] for _ in range(N)]
+        lines.append(N)
+        lines.extend(_row(row) for row in grid)
+    return _join(lines)
+
+
+@register('etc-사격_게임')
+def balloon(rng: random.Random, kind: str, scale: int) -> str:
+    """N<=10, 점수 1~100 (추정). worst: 모두 같은 값이라 상한 가지치기가 무력,
+    adversarial: 오름차순이라 큰 값이 끝에 몰린 경우"""
+    T = 10 * scale
+    lines = [T]
+    for _ in range(T):
+        N = 10 if kind != 'random' else rng.randint(1, 10)
+        if kind == 'worst':
+            values = [rng.randint(1, 100)] * N
+        elif kind == 'adversarial':
+            values = sorted(rng.randint(1, 100) for _ in range(N))
+        else:
+            values = [rng.randint(1, 100) for _ in range(N)]
+        lines.append(N)
+        lines.append(_row(values))
+    return _join(lines)
+
+
+@register('swea-1244')
+def max_prize(rng: random.Random, kind: str, scale: int) -> str:
+    """숫자판 6자리 이하, 교환 10회 이하. adversarial 은 중복 숫자 + 홀수 교환(패리티 함정)"""
+    T = 10 * scale
+    lines = [T]
+    for _ in range(T):
+        if kind == 'worst':
+            digits = ''.join(rng.sample('123456789', 6))
+            swaps = 10
+        elif kind == 'adversarial':
+            digits = ''.join(sorted(rng.choices('6789', k=6)))
+            swaps = rng.choice((7, 9))
+        else:
+            digits = ''.join(rng.choices('0123456789', k=rng.randint(2, 6)))
+            digits = rng.choice('123456789') + digits[1:]
+            swaps = rng.randint(1, 10)
+        lines.append(f'{digits} {swaps}')
+    return _join(lines)
+
+
+@register('etc-몬스터_마스터')
+def monster_master(rng: random.Random, kind: str, scale: int) -> str:
+    """N 3~10, 몬스터/고객 쌍 최대 4. adversarial: 몬스터는 먼 구석, 고객은 출발점 근처"""
+    T = 10 * scale
+    lines = [T]
+    for _ in range(T):
+        N = 10 if kind != 'random' else rng.randint(3, 10)
+        pairs = 4 if kind != 'random' else rng.randint(1, 4)
+        grid = [[0] * N for _ in range(N)]
+        cells = [(r, c) for r in range(N) for c in range(N) if (r, c) != (0, 0)]
+        if kind == 'adversarial':
+            cells.sort(key=lambda rc: rc[0] + rc[1])
+            near, far = cells[:pairs], cells[-pairs:]
+            for k in range(1, pairs + 1):
+                grid[far[k - 1][0]][far[k - 1][1]] = k
+                grid[near[k - 1][0]][near[k - 1][1]] = -k
+        else:
+            chosen = rng.sample(cells, 2 * pairs)
+            for k in range(1, pairs + 1):
+                r, c = chosen[2 * k - 2]
+                grid[r][c] = k
+                r, c = chosen[2 * k - 1]
+                grid[r][c] = -k
+        lines.append(N)
+        lines.extend(_row(row) for row in grid)
+    return _join(lines)
+
+
+# ---------------------------------------------------------------- 격자
+# scale 은 격자 원소 수
+
+@register('swea-1216')
+def palindrome_board(rng: random.Random, kind: str, scale: int) -> str:
+    """100x100, 문자 A/B/C, 테스트 10개. worst: 회문이 길이 1뿐이라 긴 길이부터 훑는 풀이가 끝까지 도는 경우,
+    adversarial: worst 에 긴 회문 하나를 마지막 열 근처에 숨긴 경우"""
+    N = _side(100, scale)
+    lines = []
+    for tc in range(1, 11):
+        if kind == 'random':
+            board = [[rng.choice('ABC') for _ in range(N)] for _ in range(N)]
+        else:
+            board = [['ABC'[(r + c) % 3] for c in range(N)] for r in range(N)]
+            if kind == 'adversarial':
+                length = rng.randint(N // 3, N // 2)
+                col = N - 1 - rng.randrange(3)
+                start = rng.randrange(N - length + 1)
+                for i in range((length + 1) // 2):
+                    board[start + i][col] = board[start + length - 1 - i][col] = rng.choice('ABC')
+        lines.append(tc)
+        lines.extend(''.join(row) for row in board)
+    return _join(lines)
+
+
+@register('swea-1215')
+def palindrome_count(rng: random.Random, kind: str, scale: int) -> str:
+    """8x8, 찾을 길이 1~8, 테스트 10개. worst: 모두 같은 문자라 모든 구간이 회문"""
+    N = _side(8, scale)
+    lines = []
+    for _ in range(10):
+        if kind == 'worst':
+            length = N // 2
+            board = ['A' * N] * N
+        elif kind == 'adversarial':
+            length = rng.randint(2, N)
+            board = [''.join('AB'[(r + c) % 2] for c in range(N)) for r in range(N)]
+        else:
+            length = rng.randint(1, N)
+            board = [''.join(rng.choice('ABC') for _ in range(N)) for _ in range(N)]
+        lines.append(length)
+        lines.extend(board)
+    return _join(lines)
+
+
+@register('swea-1989')
+def palindrome_word(rng: random.Random, kind: str, scale: int) -> str:
+    """단어 길이 3~10. scale 은 단어 길이. adversarial: 가운데 한 글자만 다른 거의 회문"""
+    T = 10
+    max_len = 10 * scale
+    lines = [T]
+    for _ in range(T):
+        n = max_len if kind != 'random' else rng.randint(3, max_len)
+        half = ''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=n // 2))
+        middle = rng.choice('abc') if n % 2 else ''
+        word = half + middle + half[::-1]
+        if kind == 'adversarial' and n > 1:
+            i = n // 2 - 1
+            word = word[:i] + ('z' if word[i] != 'z' else 'y') + word[i + 1:]
+        elif kind == 'random' and rng.random() < 0.5:
+            word = ''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=n))
+        lines.append(word)
+    return _join(lines)
+
+
+@register('swea-1249')
+def supply_route(rng: random.Random, kind: str, scale: int) -> str:
+    """N<=100, 칸 비용 0~9, 출발/도착 0. worst: 9 로 막힌 벽 사이 비용 1 의 뱀 모양 통로(최단 경로가 최장),
+    adversarial: 가로 띠마다 비용이 번갈아 커져 큐 기반 BFS 가 같은 칸을 여러 번 갱신하는 경우"""
+    N = _side(100, scale)
+    T = 10
+    lines = [T]
+    for _ in range(T):
+        if kind == 'worst':
+            grid = [[9 if r % 2 else 1 for _ in range(N)] for r in range(N)]
+            for r in range(1, N, 2):
+                grid[r][N - 1 if r % 4 == 1 else 0] = 1
+        elif kind == 'adversarial':
+            grid = [[(9 - (c * 9) // max(1, N - 1)) if r % 2 else rng.randint(0, 2) for c in range(N)] for r in range(N)]
+        else:
+            grid = [[rng.randint(0, 9) for _ in range(N)] for _ in range(N)]
+        grid[0][0] = grid[N - 1][N - 1] = 0
+        lines.append(N)
+        lines.extend(''.join(map(str, row)) for row in grid)
+    return _join(lines)
+
+
+@register('swea-1953')
+def fugitive(rng: random.Random, kind: str, scale: int) -> str:
+    """N, M 5~50, L 1~20, 터널 0~7. scale 은 격자 원소 수(L 도 한 변과 같은 비율).
+    worst: 전부 1 번 터널이라 L 안의 모든 칸에 도달, adversarial: 0 없이 2~7 번만 섞인 미로"""
+    N = M = _side(50, scale)
+    L = _side(20, scale)
+    T = 10
+    lines = [T]
+    for _ in range(T):
+        n, m = (N, M) if kind != 'random' else (rng.randint(5, N), rng.randint(5, M))
+        r, c = rng.randrange(n), rng.randrange(m)
+        length = L if kind != 'random' else rng.randint(1, L)
+        if kind == 'worst':
+            grid = [[1] * m for _ in range(n)]
+        elif kind == 'adversarial':
+            grid = [[rng.randint(2, 7) for _ in range(m)] for _ in range(n)]
+        else:
+            grid = [[rng.choice((0, 0, 1, 2, 3, 4, 5, 6, 7)) for _ in range(m)] for _ in range(n)]
+        grid[r][c] = grid[r][c] or 1
+        lines.append(_row((n, m, r, c, length)))
+        lines.extend(_row(row) for row in grid)
+    return _join(lines)
+
+
+@register('swea-4613')
+def russian_flag(rng: random.Random, kind: str, scale: int) -> str:
+    """N, M 3~50, W/B/R. adversarial: 위에서부터 R, B, W 로 뒤집혀 거의 모든 칸을 다시 칠해야 하는 경우"""
+    N = M = _side(50, scale)
+    T = 10
+    lines = [T]
+    for _ in range(T):
+        n, m = (N, M) if kind != 'random' else (rng.randint(3, N), rng.randint(3, M))
+        if kind == 'adversarial':
+            board = ['RBW'[min(2, r * 3 // n)] * m for r in range(n)]
+        else:
+            board = [''.join(rng.choice('WBR') for _ in range(m)) for _ in range(n)]
+        lines.append(_row((n, m)))
+        lines.extend(board)
+    return _join(lines)
+
+
+@register('etc-경비병')
+def guard(rng: random.Random, kind: str, scale: int) -> str:
+    """N<=100 (추정), 0 빈칸 1 벽 2 경비병 하나. worst: 벽 없이 경비병이 가운데"""
+    N = _side(100, scale)
+    T = 10
+    lines = [T]
+    for _ in range(T):
+        n = N if kind != 'random' else rng.randint(3, N)
+        if kind == 'worst':
+            grid = [[0] * n for _ in range(n)]
+            grid[n // 2][n // 2] = 2
+        else:
+            density = 0.2 if kind == 'random' else 0.05
+            grid = [[1 if rng.random() < density else 0 for _ in range(n)] for _ in range(n)]
+            r, c = (0, 0) if kind == 'adversarial' else (rng.randrange(n), rng.randrange(n))
+            grid[r][c] = 2
+        lines.append(n)
+        lines.extend(_row(row) for row in grid)
+    return _join(lines)
+
+
+@register('etc-섬_찾기')
+def islands(rng: random.Random, kind: str, scale: int) -> str:
+    """N, M<=100 (추정), 8방향 연결. 테스트 케이스 없이 격자 하나.
+    worst: 체스판 무늬라 대각선으로 전부 이어진 섬 하나, adversarial: 두 칸 간격 점이라 섬 개수 최대"""
+    N = M = _side(100, scale)
+    if kind == 'worst':
+        grid = [[(r + c + 1) % 2 for c in range(M)] for r in range(N)]
+    elif kind == 'adversarial':
+        grid = [[int(r % 2 == 0 and c % 2 == 0) for c in range(M)] for r in range(N)]
+    else:
+        grid = [[int(rng.random() < 0.5) for _ in range(M)] for _ in range(N)]
+    return _join([_row((N, M))] + [''.join(map(str, row)) for row in grid])
+
+
+# ---------------------------------------------------------------- 수열 / 배낭
+# scale 은 원소 수
+
+@register('boj-1244')
+def switch_toggle(rng: random.Random, kind: str, scale: int) -> str:
+    """스위치 N<=100, 학생 <=100 (테스트 케이스 하나). worst: 좌우 대칭 스위치에 가운데 여학생과
+    1번 남학생(전부 뒤집어도 대칭 유지)이 번갈아 와서 매번 끝까지 퍼지는 경우,
+    adversarial: 양 끝 스위치의 여학생과 번호 N 의 남학생(경계 인덱스)"""
+    N = 100 * scale
+    M = 100 * scale
+    n = N if kind != 'random' else rng.randint(1, N)
+    m = M if kind != 'random' else rng.randint(1, M)
+    if kind == 'worst':
+        half = [rng.randint(0, 1) for _ in range(n // 2)]
+        switches = half + [rng.randint(0, 1)] * (n % 2) + half[::-1]
+        students = [(1, 1) if i % 2 else (2, (n + 1) // 2) for i in range(m)]
+    elif kind == 'adversarial':
+        switches = [rng.randint(0, 1) for _ in range(n)]
+        students = [rng.choice(((2, 1), (2, n), (1, n))) for _ in range(m)]
+    else:
+        switches = [rng.randint(0, 1) for _ in range(n)]
+        students = [(rng.randint(1, 2), rng.randint(1, n)) for _ in range(m)]
+    lines = [n, _row(switches), m]
+    lines.extend(_row(student) for student in students)
+    return _join(lines)
+
+
+@register('etc-A_2025_나무의_키')
+def tree_height(rng: random.Random, kind: str, scale: int) -> str:
+    """N 2~100, 키 1~120. worst: 하나만 120 이고 나머지는 1,
+    adversarial: 부족분이 모두 2 라 1/2 배분을 다시 맞춰야 하는 경우"""
+    N = 100 * scale
+    T = 10
+    lines = [T]
+    for _ in range(T):
+        n = N if kind != 'random' else rng.randint(2, N)
+        if kind == 'worst':
+            heights = [1] * (n - 1) + [120]
+        elif kind == 'adversarial':
+            heights = [118] * (n - 1) + [120]
+        else:
+            heights = [rng.randint(1, 120) for _ in range(n)]
+        rng.shuffle(heights)
+        lines.append(n)
+        lines.append(_row(heights))
+    return _join(lines)
+
+
+@register('swea-1486')
+def shelf(rng: random.Random, kind: str, scale: int) -> str:
+    """N<=20, 키 1~10000. worst: B 가 총합의 절반이라 후보가 가장 많음,
+    adversarial: B 가 총합에 가까워 가지치기가 늦게 걸리는 경우"""
+    N = 20 * scale
+    T = 10
+    lines = [T]
+    for _ in range(T):
+        n = N if kind != 'random' else rng.randint(1, N)
+        heights = [rng.randint(1, 10000) for _ in range(n)]
+        total = sum(heights)
+        if kind == 'worst':
+            B = total // 2
+        elif kind == 'adversarial':
+            B = total - min(heights) + 1
+        else:
+            B = rng.randint(1, total)
+        lines.append(_row((n, B)))
+        lines.append(_row(heights))
+    return _join(lines)
+
+
+@register('swea-5215')
+def hamburger(rng: random.Random, kind: str, scale: int) -> str:
+    """N<=20, L<=10000. worst: 칼로리가 작아 거의 모든 조합이 제한 안에 드는 경우"""
+    N = 20 * scale
+    T = 10
+    lines = [T]
+    for _ in range(T):
+        n = N if kind != 'random' else rng.randint(1, N)
+        L = 10000 if kind != 'random' else rng.randint(1, 10000)
+        if kind == 'worst':
+            items = [(rng.randint(1, 1000), rng.randint(1, 10)) for _ in range(n)]
+        elif kind == 'adversarial':
+            items = [(rng.randint(900, 1000), L // 2 + rng.randint(-50, 50)) for _ in range(n)]
+        else:
+            items = [(rng.randint(1, 1000), rng.randint(1, L)) for _ in range(n)]
+        lines.append(_row((n, L)))
+        lines.extend(_row(item) for item in items)
+    return _join(lines)
+
+
+@register('swea-16811')
+def carrot(rng: random.Random, kind: str, scale: int) -> str:
+    """N<=1000, 크기 1~30. adversarial: 크기 종류가 적어 나눌 수 없는(-1) 경우"""
+    N = 1000 * scale
+    T = 10
+    lines = [T]
+    for _ in range(T):
+        n = N if kind != 'random' else rng.randint(3, N)
+        if kind == 'adversarial':
+            sizes = [rng.randint(1, 2) for _ in range(n)]
+        else:
+            sizes = [rng.randint(1, 30) for _ in range(n)]
+        lines.append(n)
+        lines.append(_row(sizes))
+    return _join(lines)
+
+
+@register('etc-탑_쌓기')
+def tower(rng: random.Random, kind: str, scale: int) -> str:
+    """N = W1 + W2 <= 100 (추정), 무게 1~100"""
+    N = 100 * scale
+    T = 10
+    lines = [T]
+    for _ in range(T):
+        n = N if kind != 'random' else rng.randint(2, N)
+        w1 = n // 2 if kind != 'adversarial' else 1
+        lines.append(_row((n, w1, n - w1)))
+        lines.append(_row(rng.randint(1, 100) for _ in range(n)))
+    return _join(lines)
+
+
+# ---------------------------------------------------------------- 그래프 / 트리
+# scale 은 정점 수
+
+@register('swea-7465')
+def village(rng: random.Random, kind: str, scale: int) -> str:
+    """N<=100. worst: 1-2-...-N 한 줄(재귀 DFS 가 가장 깊음), adversarial: 고립 정점 + 긴 사슬"""
+    N = 100 * scale
+    T = 10
+    lines = [T]
+    for _ in range(T):
+        n = N if kind != 'random' else rng.randint(1, N)
+        if kind == 'worst':
+            edges = [(i, i + 1) for i in range(1, n)]
+        elif kind == 'adversarial':
+            chain = list(range(1, n + 1))
+            rng.shuffle(chain)
+            chain = chain[: n // 2]
+            edges = list(zip(chain, chain[1:]))
+        else:
+            m = rng.randint(0, min(n * (n - 1) // 2, 3 * n))
+            edges = [tuple(rng.sample(range(1, n + 1), 2)) for _ in range(m)] if n > 1 else []
+        lines.append(_row((n, len(edges))))
+        lines.extend(_row(e) for e in edges)
+    return _join(lines)
+
+
+@register('swea-1248')
+def common_ancestor(rng: random.Random, kind: str, scale: int) -> str:
+    """V<=10000 이진 트리. worst: 루트에서 갈라진 두 긴 가지 끝의 두 정점(경로 비교가 최대),
+    adversarial: 번호를 섞은 깊은 사슬"""
+    V = 10000 * scale
+    T = 10
+    lines = [T]
+    for _ in range(T):
+        v = V if kind != 'random' else rng.randint(3, V)
+        if kind == 'worst':
+            edges = [(1, 2), (1, 3)] + [(i, i + 2) for i in range(2, v - 1)]
+            a, b = v - 1, v
+        elif kind == 'adversarial':
+            labels = list(range(2, v + 1))
+            rng.shuffle(labels)
+            labels = [1] + labels
+            edges = [(labels[i], labels[i + 1]) for i in range(v - 1)]
+            a, b = labels[-1], labels[v // 2]
+        else:
+            edges = _random_tree_edges(rng, v)
+            a, b = rng.sample(range(2, v + 1), 2)
+        lines.append(_row((v, len(edges), a, b)))
+        lines.append(_row(x for e in edges for x in e))
+    return _join(lines)
+
+
+@register('swea-1267')
+def work_order(rng: random.Random, kind: str, scale: int) -> str:
+    """V<=1000, 테스트 10개. worst: 번호를 섞은 조밀한 DAG,
+    adversarial: 한 정점에서 모든 정점으로 퍼졌다 모이는 넓은 DAG(큐 멤버십 검사가 가장 느림)"""
+    V = 1000 * scale
+    lines = []
+    for _ in range(10):
+        v = V if kind != 'random' else rng.randint(2, V)
+        order = list(range(1, v + 1))
+        rng.shuffle(order)
+        if kind == 'adversarial':
+            edges = [(order[0], x) for x in order[1:-1]] + [(x, order[-1]) for x in order[1:-1]]
+        else:
+            m = 3 * v if kind == 'worst' else rng.randint(v - 1, 2 * v)
+            m = min(m, v * (v - 1) // 2)    # v 가 작으면 서로 다른 간선이 모자란다
+            edges = set((order[i], order[i + 1]) for i in range(v - 1))
+            while len(edges) < m:
+                i, j = sorted(rng.sample(range(v), 2))
+                edges.add((order[i], order[j]))
+            edges = list(edges)
+            rng.shuffle(edges)
+        lines.append(_row((v, len(edges))))
+        lines.append(_row(x for e in edges for x in e))
+    return _join(lines)
+
+
+@register('etc-학교_졸업하기')
+def graduation(rng: random.Random, kind: str, scale: int) -> str:
+    """N 2~100, 선수과목 총합 <= 120. worst: 한 줄 사슬(학기 수 N),
+    adversarial: 긴 사슬 끝에 되돌아가는 간선(순환)"""
+    N = 100 * scale
+    budget = 120 * scale
+    T = 10
+    lines = [T]
+    for _ in range(T):
+        n = N if kind != 'random' else rng.randint(2, N)
+        order = list(range(1, n + 1))
+        rng.shuffle(order)
+        prereq = {x: [] for x in order}
+        for i in range(1, n):
+            prereq[order[i]].append(order[i - 1])
+        if kind == 'adversarial':
+            prereq[order[0]].append(order[-1])
+        elif kind == 'random':
+            for _ in range(max(0, min(budget, 2 * n) - (n - 1))):
+                i, j = sorted(rng.sample(range(n), 2))
+                if order[i] not in prereq[order[j]]:
+                    prereq[order[j]].append(order[i])
+        lines.append(n)
+        lines.extend(_row([len(prereq[x])] + prereq[x]) for x in range(1, n + 1))
+    return _join(lines)
@@ -0,0 +1,40 @@
+"""입력 메모: 테스트 입력마다 줄 목록을 프로세스 안에서 한 번만 만든다.
+
+같은 입력을 여러 풀이(예: swea-4613 의 11개 구현)가 차례로 읽을 때마다 ``splitlines()`` 를
+반복하지 않도록, 입력 텍스트를 키로 ``ParsedInput`` 을 기억해 둔다. 워커(또는 fork 서버)에서
+만들어 두면 fork 한 자식은 같은 줄 목록을 복사 없이 그대로 쓴다.
+
+줄 목록만 기억한다. 풀이들은 ``input().split()`` 으로 직접 정수를 바꾸므로 정수 행이나
+파일/mmap 형식으로 미리 만들어 둘 것이 없고, 워커 사이에서는 각자 한 번씩 나눈다.
+"""
+
+
+class ParsedInput:
+    """입력 텍스트와 한 번만 나누는 줄 목록"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._lines: list[str] | None = None
+
+    @property
+    def lines(self) -> list[str]:
+        """줄 목록 (str 은 불변이라 풀이끼리 공유해도 된다)"""
+        if self._lines is None:
+            self._lines = self.text.splitlines()
+        return self._lines
+
+    @property
+    def size(self) -> int:
+        return len(self.lines)
+
+
+# 입력 텍스트 -> ParsedInput. str 의 해시는 객체에 캐시되므로 같은 TestCase 로 다시 찾는 건 빠르다.
+_loaded: dict[str, ParsedInput] = {}
+
+
+def parsed(text: str) -> ParsedInput:
+    """text 의 ParsedInput, 이 프로세스에서 처음이면 만든다"""
+    result = _loaded.get(text)
+    if result is None:
+        result = _loaded[text] = ParsedInput(text)
+    return result
@@ -0,0 +1,166 @@
+"""풀이 프로파일링: 파일을 고치지 않고 느린 원인을 찾는다.
+
+- 함수: cProfile (항상)
+- 줄: sys.settrace 기반 줄 단위 실행 횟수/시간 (lines=True)
+- 메모리: tracemalloc 으로 가장 많이 할당한 줄 (memory=True)
+
+보고서는 ``{out_dir}/{멤버ID}/{주차}/{파일명}.prof.txt`` 에 쓰며, 위치는
+``경로:줄번호`` 형태로 적어 에디터에서 바로 열 수 있게 한다.
+"""
+
+import cProfile
+import io
+import linecache
+import pstats
+import sys
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from .discovery import Solution
+from .runner import compile_solution, execute
+from .testset import TestCase
+
+TOP_FUNCTIONS = 25
+TOP_LINES = 20
+TOP_ALLOCATIONS = 10
+
+
+class LineTimer:
+    """한 파일의 줄별 실행 횟수와 시간(하위 호출 제외, 라이브러리 호출 포함)"""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.hits: Counter = Counter()
+        self.times: defaultdict = defaultdict(float)
+        self._stack: list[int] = []
+        self._last = 0.0
+
+    def __enter__(self):
+        self._last = time.perf_counter()
+        sys.settrace(self._trace_call)
+        return self
+
+    def __exit__(self, *exc):
+        sys.settrace(None)
+        self._stack.clear()
+
+    def _tick(self) -> None:
+        now = time.perf_counter()
+        if self._stack:
+            self.times[self._stack[-1]] += now - self._last
+        self._last = now
+
+    def _trace_call(self, frame, event, arg):
+        if frame.f_code.co_filename != self.filename:
+            return None
+        self._tick()
+        self._stack.append(frame.f_lineno)
+        return self._trace_line
+
+    def _trace_line(self, frame, event, arg):
+        self._tick()
+        if event == 'line':
+            self.hits[frame.f_lineno] += 1
+            self._stack[-1] = frame.f_lineno
+        elif event == 'return':
+            self._stack.pop()
+        return self._trace_line
+
+
+def _source_line(path: str, lineno: int) -> str:
+    return linecache.getline(path, lineno).strip()
+
+
+def _fmt_size(n: int) -> str:
+    for unit in ('B', 'KB', 'MB'):
+        if n < 1024:
+            return f'{n:.0f}{unit}'
+        n /= 1024
+    return f'{n:.1f}GB'
+
+
+def profile_solution(
+    solution: Solution,
+    cases: list[TestCase],
+    out_dir: Path,
+    lines: bool = False,
+    memory: bool = False,
+) -> Path:
+    """모든 케이스를 차례로 실행하며 측정하고 보고서 경로를 돌려준다
+
+    문법 오류로 컴파일되지 않으면 CE 만 적은 보고서를 남긴다 (``judge_solution`` 의 CE 판정과 같다).
+    """
+    path = str(solution.path)
+    out_path = Path(out_dir) / solution.member / solution.week / f'{solution.name}.prof.txt'
+    try:
+        code = compile_solution(solution.path)
+    except SyntaxError as e:
+        return _write_report(out_path, f'{path}\nCE {type(e).__name__}: {e}\n')
+
+    profiler = cProfile.Profile()
+    timer = LineTimer(path) if lines else None
+    allocations: dict[int, tracemalloc.Statistic] = {}
+    errors = []
+    elapsed = 0.0
+    peak = 0
+
+    for case in cases:
+        namespace = {}
+        if memory:
+            tracemalloc.start()
+        profiler.enable()
+        if timer is not None:
+            with timer:
+                run = execute(code, case.input, namespace)
+        else:
+            run = execute(code, case.input, namespace)
+        profiler.disable()
+        if memory:
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(True, path)])
+            tracemalloc.stop()
+            for stat in snapshot.statistics('lineno'):
+                lineno = stat.traceback[0].lineno
+                if lineno not in allocations or allocations[lineno].size < stat.size:
+                    allocations[lineno] = stat
+        namespace.clear()
+
+        elapsed += run.elapsed
+        if run.error is not None:
+            errors.append(f'{case.name}: {run.error}')
+
+    report = io.StringIO()
+    report.write(f'{path}\n')
+    report.write(f'케이스 {len(cases)}개 ({", ".join(c.name for c in cases)}), 실행 {elapsed * 1000:.2f}ms\n')
+    for error in errors:
+        report.write(f'에러 {error}\n')
+
+    report.write('\n== 함수 (cProfile, 자체 시간 순) ==\n')
+    stats = pstats.Stats(profiler, stream=report)
+    stats.sort_stats('tottime').print_stats(TOP_FUNCTIONS)
+
+    if timer is not None:
+        report.write('== 줄 (실행 횟수 / 하위 호출 제외 시간) ==\n')
+        for lineno, spent in sorted(timer.times.items(), key=lambda kv: -kv[1])[:TOP_LINES]:
+            report.write(
+                f'{path}:{lineno:<5} {timer.hits[lineno]:>10,}회 {spent * 1000:>10.2f}ms  | {_source_line(path, lineno)}\n'
+            )
+        report.write('\n')
+
+    if memory:
+        report.write(f'== 메모리 할당 (tracemalloc, 최대 {_fmt_size(peak)}, 줄별은 실행 종료 시점에 남은 크기) ==\n')
+        for lineno, stat in sorted(allocations.items(), key=lambda kv: -kv[1].size)[:TOP_ALLOCATIONS]:
+            report.write(
+                f'{path}:{lineno:<5} {_fmt_size(stat.size):>8} {stat.count:>8,}개  | {_source_line(path, lineno)}\n'
+            )
+        report.write('\n')
+
+    return _write_report(out_path, report.getvalue())
+
+
+def _write_report(out_path: Path, text: str) -> Path:
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(text, encoding='utf-8')
+    return out_path
@@ -0,0 +1,187 @@
+"""풀이 파일을 인터프리터 안에서 바로 실행하는 러너.
+
+풀이마다 ``python 파일.py`` 로 새 프로세스를 띄우지 않고, 한 번 컴파일한 코드 객체를
+stdin/stdout 을 메모리 버퍼로 바꿔 끼운 채 ``exec`` 한다. stdin 과 전역 ``input`` 은
+``fastio.FastReader`` 로 바꿔 끼워 줄 단위 입력도 bytes 에서 바로 읽게 한다.
+"""
+
+import builtins
+import io
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from types import CodeType
+
+from .checker import StreamingChecker, WrongAnswer
+from .discovery import Solution, blob_sha
+from .fastio import FastReader
+from .inputcache import ParsedInput, parsed
+from .testset import TestCase
+
+# 로컬 실행용 프롤로그: sys.stdin = open('input.txt', 'r') 등
+# 줄 번호가 바뀌지 않도록 같은 들여쓰기의 pass 로 바꾼다.
+PROLOGUE_PATTERN = re.compile(r'^([ \t]*)sys\.stdin\s*=\s*open\(.*$', re.MULTILINE)
+
+
+class Verdict(str, Enum):
+    AC = 'AC'   # 정답
+    WA = 'WA'   # 오답
+    RE = 'RE'   # 런타임 에러
+    TLE = 'TLE'  # 시간 초과 (sandbox)
+    MLE = 'MLE'  # 메모리 초과 (sandbox)
+    CE = 'CE'   # 컴파일(문법) 에러
+    OK = 'OK'   # 정답 파일이 없어 실행만 확인
+
+
+@dataclass
+class Execution:
+    output: str
+    elapsed: float
+    error: str | None = None
+
+
+@dataclass
+class CaseResult:
+    name: str
+    verdict: Verdict
+    elapsed: float = 0.0
+    detail: str | None = None
+    cached: bool = False
+    memory: int | None = None   # 최대 RSS (KiB), sandbox 실행에서만
+
+
+@dataclass
+class SolutionResult:
+    solution_id: str
+    cases: list[CaseResult] = field(default_factory=list)
+
+    @property
+    def verdict(self) -> Verdict:
+        for verdict in (Verdict.CE, Verdict.RE, Verdict.MLE, Verdict.TLE, Verdict.WA):
+            if any(case.verdict == verdict for case in self.cases):
+                return verdict
+        if any(case.verdict == Verdict.OK for case in self.cases):
+            return Verdict.OK
+        return Verdict.AC
+
+    @property
+    def elapsed(self) -> float:
+        return sum(case.elapsed for case in self.cases)
+
+    @property
+    def memory(self) -> int | None:
+        peaks = [case.memory for case in self.cases if case.memory is not None]
+        return max(peaks) if peaks else None
+
+
+def prepare_source(source: str) -> str:
+    return PROLOGUE_PATTERN.sub(r'\1pass', source)
+
+
+# blob sha -> 코드 객체. 같은 내용의 파일은 한 번만 컴파일한다.
+_code_cache: dict[str, CodeType] = {}
+
+
+def compile_solution(path: Path) -> CodeType:
+    return compile_cached(path)[1]
+
+
+def compile_cached(path: Path) -> tuple[str, CodeType]:
+    """(blob sha, 코드 객체). 문법 오류는 SyntaxError 그대로 올린다."""
+    data = Path(path).read_bytes()
+    sha = blob_sha(data)
+    code = _code_cache.get(sha)
+    if code is None:
+        source = data.decode('utf-8-sig')
+        code = _code_cache[sha] = compile(prepare_source(source), str(path), 'exec')
+    return sha, code
+
+
+def execute(
+    code: CodeType,
+    stdin_text: str | bytes | ParsedInput,
+    namespace: dict | None = None,
+    stdout=None,
+) -> Execution:
+    """code 를 __main__ 으로 실행하고 표준 출력을 돌려준다
+
+    namespace 를 넘기면 그 dict 를 전역으로 쓰므로 실행 뒤에도 풀이의 전역 객체가 살아 있다.
+    stdout 을 넘기면 출력을 모으지 않고 그쪽으로 보낸다 (Execution.output 은 빈 문자열).
+    """
+    if namespace is None:
+        namespace = {}
+    reader = FastReader(stdin_text)
+    # 풀이가 input 을 다시 정의하면(input = sys.stdin.readline 등) 그쪽이 우선한다
+    namespace.update({'__name__': '__main__', '__builtins__': builtins, 'input': reader.input})
+
+    saved_stdin, saved_stdout = sys.stdin, sys.stdout
+    saved_limit = sys.getrecursionlimit()
+
+    out = io.StringIO() if stdout is None else stdout
+    sys.stdin = reader
+    sys.stdout = out
+    error = None
+
+    start = time.perf_counter()
+    try:
+        exec(code, namespace)
+    except SystemExit:
+        pass
+    except Exception as e:
+        error = f'{type(e).__name__}: {e}'
+    finally:
+        elapsed = time.perf_counter() - start
+        sys.stdin, sys.stdout = saved_stdin, saved_stdout
+        sys.setrecursionlimit(saved_limit)
+
+    return Execution(out.getvalue() if stdout is None else '', elapsed, error)
+
+
+def check(output: str, expected: str) -> bool:
+    """공백 차이는 무시하고 토큰 단위로 비교"""
+    return output.split() == expected.split()
+
+
+class _Discard:
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def judge_case(code: CodeType, case: TestCase) -> CaseResult:
+    """출력은 모으지 않고 StreamingChecker 로 바로 비교해, 처음 틀린 곳에서 실행을 끊는다"""
+    checker = StreamingChecker(case.expected) if case.expected is not None else None
+    start = time.perf_counter()
+    try:
+        run = execute(code, parsed(case.input), stdout=checker or _Discard())
+    except WrongAnswer as e:
+        return CaseResult(case.name, Verdict.WA, time.perf_counter() - start, str(e))
+    if checker is not None and checker.failure is not None:
+        # 풀이가 WrongAnswer 를 삼킨 경우
+        return CaseResult(case.name, Verdict.WA, run.elapsed, checker.failure)
+    if run.error is not None:
+        return CaseResult(case.name, Verdict.RE, run.elapsed, run.error)
+    if checker is None:
+        return CaseResult(case.name, Verdict.OK, run.elapsed)
+    failure = checker.finish()
+    if failure is None:
+        return CaseResult(case.name, Verdict.AC, run.elapsed)
+    return CaseResult(case.name, Verdict.WA, run.elapsed, failure)
+
+
+def judge_solution(solution: Solution, cases: list[TestCase]) -> SolutionResult:
+    result = SolutionResult(solution.id)
+
+    try:
+        code = compile_solution(solution.path)
+    except SyntaxError as e:
+        result.cases = [CaseResult(case.name, Verdict.CE, detail=str(e)) for case in cases]
+        return result
+
+    result.cases = [judge_case(code, case) for case in cases]
+    return result
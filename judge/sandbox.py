@@ -0,0 +1,105 @@
+"""자원 제한 실행: 테스트 케이스마다 fork 한 자식에 CPU 시간/주소 공간 rlimit 을 걸고,
+부모는 벽시계 제한이 지나면 자식을 죽인다.
+메모리 제한과 보고하는 최대 RSS 는 모두 fork 시점의 워커 메모리를 뺀 증가분 기준이다.
+
+끝없이 커지는 BFS 큐나 종료 조건 없는 재귀 같은 풀이 하나가 일괄 채점 전체를
+멈추거나 메모리를 다 먹지 못하게 한다. 판정은 TLE / MLE / RE 이며 최대 RSS 를 함께 남긴다.
+"""
+
+import math
+import os
+import resource
+import select
+import signal
+import time
+from dataclasses import dataclass
+
+from .runner import CaseResult, Verdict
+
+
+@dataclass(frozen=True)
+class Limits:
+    cpu: float = 10.0               # 초, RLIMIT_CPU
+    wall: float | None = None       # 초, 없으면 cpu * 2 + 1
+    memory: int | None = 1024       # MB, RLIMIT_AS (워커가 이미 쓰는 주소 공간에 더해서)
+
+    @property
+    def wall_limit(self) -> float:
+        return self.wall if self.wall is not None else self.cpu * 2 + 1
+
+
+DEFAULT_LIMITS = Limits()
+
+
+def _address_space() -> int | None:
+    """현재 프로세스의 가상 메모리 크기(bytes), /proc 이 없으면 None"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return None
+
+
+def resident_memory() -> int:
+    """현재 프로세스의 상주 메모리(KiB), /proc 이 없으면 0. fork 직전에 재어 자식 최대 RSS 에서 뺀다."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError):
+        return 0
+
+
+def apply_limits(limits: Limits) -> None:
+    """fork 된 자식에서 실행 직전에 호출
+
+    RLIMIT_CPU 는 정수 초만 받으므로 올림한 값은 폭주를 끊는 안전장치일 뿐이고,
+    소수 제한의 판정은 부모가 자식의 rusage CPU 시간으로 한다 (``forkserver.run_forked``).
+    """
+    cpu = math.ceil(limits.cpu)
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+    if limits.memory is not None:
+        ceiling = limits.memory * 1024 * 1024 + (_address_space() or 0)
+        resource.setrlimit(resource.RLIMIT_AS, (ceiling, ceiling))
+
+
+def read_with_deadline(fd: int, timeout: float) -> tuple[bytes, bool]:
+    """fd 를 EOF 까지 읽는다. (내용, 제한 시간 안에 끝났는지)"""
+    chunks = []
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return b''.join(chunks), False
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            return b''.join(chunks), False
+        chunk = os.read(fd, 1 << 16)
+        if not chunk:
+            return b''.join(chunks), True
+        chunks.append(chunk)
+
+
+def classify(name: str, result: CaseResult | None, status: int, peak: int, elapsed: float, limits: Limits) -> CaseResult:
+    """자식의 결과/종료 상태/최대 RSS(KiB, fork 시점 대비 증가분)로 최종 판정
+
+    peak 는 ``RLIMIT_AS`` 와 같은 기준(워커가 이미 쓰던 메모리 위에 더한 양)이어야 한다.
+    """
+    near_memory_limit = limits.memory is not None and peak >= limits.memory * 1024 * 0.9
+
+    if result is not None:
+        result.memory = peak
+        if result.verdict == Verdict.RE and result.detail and result.detail.startswith('MemoryError'):
+            result.verdict = Verdict.MLE
+        return result
+
+    if os.WIFSIGNALED(status):
+        sig = signal.Signals(os.WTERMSIG(status))
+        if sig == signal.SIGXCPU:
+            return CaseResult(name, Verdict.TLE, elapsed, f'CPU {limits.cpu:g}s 초과', memory=peak)
+        if near_memory_limit:
+            return CaseResult(name, Verdict.MLE, elapsed, f'{limits.memory}MB 초과 ({sig.name})', memory=peak)
+        return CaseResult(name, Verdict.RE, elapsed, f'killed by {sig.name}', memory=peak)
+
+    if near_memory_limit:
+        return CaseResult(name, Verdict.MLE, elapsed, f'{limits.memory}MB 초과', memory=peak)
+    return CaseResult(name, Verdict.RE, elapsed, f'exit status {os.WEXITSTATUS(status)}', memory=peak)
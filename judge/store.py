@@ -0,0 +1,90 @@
+"""채점 결과 저장소 (SQLite).
+
+결과는 (풀이 blob sha, 테스트 케이스 해시, 인터프리터 버전)을 키로 저장한다.
+blob sha 는 GitHub tree API 의 ``sha`` 와 같은 값이므로, 파일 내용이나 테스트가
+바뀌지 않았다면 다시 실행하지 않고 저장된 판정을 그대로 쓴다.
+"""
+
+import hashlib
+import platform
+import sqlite3
+import time
+from pathlib import Path
+
+from .runner import CaseResult, Verdict
+from .testset import TestCase
+
+DEFAULT_STORE = Path('.judge') / 'results.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    blob_sha    TEXT NOT NULL,
+    case_hash   TEXT NOT NULL,
+    interpreter TEXT NOT NULL,
+    verdict     TEXT NOT NULL,
+    elapsed     REAL NOT NULL,
+    detail      TEXT,
+    recorded_at REAL NOT NULL,
+    memory      INTEGER,
+    PRIMARY KEY (blob_sha, case_hash, interpreter)
+)
+"""
+
+
+def interpreter_tag() -> str:
+    return f'{platform.python_implementation()}-{platform.python_version()}'
+
+
+def case_hash(case: TestCase) -> str:
+    h = hashlib.sha1(case.input.encode('utf-8'))
+    h.update(b'\0')
+    if case.expected is not None:
+        h.update(case.expected.encode('utf-8'))
+    return h.hexdigest()
+
+
+class ResultStore:
+    def __init__(self, path: Path = DEFAULT_STORE, interpreter: str | None = None):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.interpreter = interpreter or interpreter_tag()
+        self._db = sqlite3.connect(path)
+        self._db.execute(SCHEMA)
+        columns = {row[1] for row in self._db.execute('PRAGMA table_info(results)')}
+        if 'memory' not in columns:
+            # memory 컬럼이 생기기 전에 만든 저장소
+            self._db.execute('ALTER TABLE results ADD COLUMN memory INTEGER')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def lookup(self, blob_sha: str, case: TestCase) -> CaseResult | None:
+        row = self._db.execute(
+            'SELECT verdict, elapsed, detail, memory FROM results '
+            'WHERE blob_sha = ? AND case_hash = ? AND interpreter = ?',
+            (blob_sha, case_hash(case), self.interpreter),
+        ).fetchone()
+        if row is None:
+            return None
+        verdict, elapsed, detail, memory = row
+        return CaseResult(case.name, Verdict(verdict), elapsed, detail, cached=True, memory=memory)
+
+    def save(self, items: list[tuple[str, TestCase, CaseResult]]) -> None:
+        now = time.time()
+        with self._db:
+            self._db.executemany(
+                'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [
+                    (
+                        sha, case_hash(case), self.interpreter,
+                        result.verdict.value, result.elapsed, result.detail, now, result.memory,
+                    )
+                    for sha, case, result in items
+                ],
+            )
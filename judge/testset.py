@@ -0,0 +1,33 @@
+"""공용 테스트 세트.
+
+``testcases/{baseName}/{케이스}.in`` 과 같은 이름의 ``.out`` 을 한 쌍으로 읽는다.
+``.out`` 이 없는 케이스는 정답 비교 없이 실행만 한다.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_TESTS_DIR = 'testcases'
+
+
+@dataclass(frozen=True)
+class TestCase:
+    name: str
+    input: str
+    expected: str | None
+
+
+def load_cases(tests_dir: Path, base_name: str) -> list[TestCase]:
+    problem_dir = Path(tests_dir) / base_name
+    if not problem_dir.is_dir():
+        return []
+
+    cases = []
+    for in_path in sorted(problem_dir.glob('*.in')):
+        out_path = in_path.with_suffix('.out')
+        cases.append(TestCase(
+            name=in_path.stem,
+            input=in_path.read_text(encoding='utf-8'),
+            expected=out_path.read_text(encoding='utf-8') if out_path.is_file() else None,
+        ))
+    return cases